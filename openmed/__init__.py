@@ -27,6 +27,7 @@ if TYPE_CHECKING:
         PIIEntity,
         deidentify,
         extract_pii,
+        extract_pii_batch,
         reidentify,
     )
     from .core.results import AnalyzeResult
@@ -94,11 +95,13 @@ _LAZY_IMPORTS = {
     "PIIEntity": ".core.pii",
     "deidentify": ".core.pii",
     "extract_pii": ".core.pii",
+    "extract_pii_batch": ".core.pii",
     "reidentify": ".core.pii",
     "PII_PATTERNS": ".core.pii_entity_merger",
     "PIIPattern": ".core.pii_entity_merger",
     "calculate_dominant_label": ".core.pii_entity_merger",
     "find_semantic_units": ".core.pii_entity_merger",
+    "find_semantic_units_batch": ".core.pii_entity_merger",
     "merge_entities_with_semantic_units": ".core.pii_entity_merger",
     "merge_india_code_mixed_spans": ".core.pii_entity_merger",
     "DEFAULT_PII_MODELS": ".core.pii_i18n",
@@ -493,7 +496,10 @@ def analyze_text(
         if final_result is not None:
             return final_result
 
-    loader = loader or model_loader(config)
+    if loader is None:
+        from .core.models import _shared_model_loader
+
+        loader = _shared_model_loader(config, model_loader)
     runtime_config = getattr(loader, "config", config)
 
     pipeline_args = dict(
@@ -908,6 +914,7 @@ __all__ = [
     "timed",
     # PII detection and de-identification
     "extract_pii",
+    "extract_pii_batch",
     "deidentify",
     "reidentify",
     "PIIEntity",
@@ -944,6 +951,7 @@ __all__ = [
     "merge_entities_with_semantic_units",
     "merge_india_code_mixed_spans",
     "find_semantic_units",
+    "find_semantic_units_batch",
     "calculate_dominant_label",
     "PII_PATTERNS",
     "PIIPattern",
@@ -60,7 +60,7 @@ from .language_router import (
 )
 from .model_integrity import ModelIntegrityError
 from .model_search import ModelQuery, ModelSearchResult, search_models
-from .models import ModelLoader, load_model
+from .models import ModelLoader, clear_shared_loaders, load_model
 from .offline import OfflineModeError
 from .redaction_preview import redaction_preview, render_redaction_preview
 from .review_workflow import (
@@ -123,6 +123,7 @@ from .surrogate_vault import (
 __all__ = [
     "ModelLoader",
     "ModelIntegrityError",
+    "clear_shared_loaders",
     "load_model",
     "ModelQuery",
     "ModelSearchResult",
@@ -71,8 +71,25 @@ def id_subtype_for_entity_type(entity_type: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+# Luhn contribution of each digit character in a plain and a doubled position.
+_LUHN_PLAIN = {str(digit): digit for digit in range(10)}
+_LUHN_DOUBLED = {str(digit): (2 * digit) % 10 + digit // 5 for digit in range(10)}
+
+
 def _digits_only(text: str) -> str:
-    return re.sub(r"[^0-9]", "", text)
+    return _NON_DIGIT_RE.sub("", text)
+
+
+def _luhn_valid(digits: str) -> bool:
+    """Return whether an ASCII-digit string, check digit included, is Luhn-valid.
+
+    Plain and doubled positions are summed over string slices through lookup
+    tables, so no per-digit ``int()`` call or branch runs in Python.
+    """
+    total = sum(map(_LUHN_PLAIN.__getitem__, digits[-1::-2]))
+    total += sum(map(_LUHN_DOUBLED.__getitem__, digits[-2::-2]))
+    return total % 10 == 0
 
 
 def validate_ssn(ssn_text: str) -> bool:
@@ -234,8 +251,7 @@ def validate_luhn(number_text: str) -> bool:
     if len(digits) < 13:
         return False
 
-    body = [int(digit) for digit in digits[:-1]]
-    return _luhn_check_digit(body) == int(digits[-1])
+    return _luhn_valid(digits)
 
 
 def validate_npi(npi_text: str) -> bool:
@@ -245,9 +261,7 @@ def validate_npi(npi_text: str) -> bool:
     if len(digits) != 10:
         return False
 
-    body = [int(digit) for digit in digits[:-1]]
-    prefixed = [8, 0, 8, 4, 0, *body]
-    return _luhn_check_digit(prefixed) == int(digits[-1])
+    return _luhn_valid("80840" + digits)
 
 
 def generate_luhn_identifier(
@@ -3367,8 +3381,7 @@ def validate_canadian_sin(text: str) -> bool:
     if digits[0] == "0":
         return False
 
-    body = [int(digit) for digit in digits[:-1]]
-    return _luhn_check_digit(body) == int(digits[-1])
+    return _luhn_valid(digits)
 
 
 def generate_canadian_sin(*, rng: random.Random | None = None) -> str:
@@ -3400,8 +3413,7 @@ def validate_ontario_health_card(text: str) -> bool:
     digits, version = _split_ontario_health_card(text)
     if len(digits) != 10:
         return False
-    body = [int(digit) for digit in digits[:-1]]
-    return _luhn_check_digit(body) == int(digits[-1])
+    return _luhn_valid(digits)
 
 
 def generate_ontario_health_card(
@@ -1,9 +1,12 @@
 """Configuration management for OpenMed."""
 
+import copy
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from .offline import (
     OFFLINE_ENV_VAR,
@@ -38,8 +41,9 @@ DEFAULT_CONFIG_DIR = _default_config_root / "openmed"
 DEFAULT_CONFIG_PATH = DEFAULT_CONFIG_DIR / "config.toml"
 PROFILES_DIR = DEFAULT_CONFIG_DIR / "profiles"
 
-# Built-in profile presets
-PROFILE_PRESETS: Dict[str, Dict[str, Any]] = {
+# Built-in profile presets. Read-only so shared presets cannot be mutated through
+# a caller; get_profile() returns a plain dict copy.
+_PROFILE_PRESET_VALUES: Dict[str, Dict[str, Any]] = {
     "dev": {
         "log_level": "DEBUG",
         "timeout": 600,
@@ -75,9 +79,12 @@ PROFILE_PRESETS: Dict[str, Dict[str, Any]] = {
         "use_medical_tokenizer": False,
     },
 }
+PROFILE_PRESETS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(values) for name, values in _PROFILE_PRESET_VALUES.items()}
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenMedConfig:
     """Configuration class for OpenMed package."""
 
@@ -364,27 +371,19 @@ class OpenMedConfig:
             ValueError: If the profile doesn't exist.
         """
         # First check built-in presets
+        profile_data: Optional[Mapping[str, Any]]
         if profile_name in PROFILE_PRESETS:
-            profile_data = dict(PROFILE_PRESETS[profile_name])
+            profile_data = PROFILE_PRESETS[profile_name]
         else:
             # Try to load from profile file
-            profile_path = PROFILES_DIR / f"{profile_name}.toml"
-            if profile_path.exists():
-                profile_data = _load_toml(profile_path)
-            else:
-                available = list(PROFILE_PRESETS.keys())
-                # Add custom profiles
-                if PROFILES_DIR.exists():
-                    for p in PROFILES_DIR.glob("*.toml"):
-                        available.append(p.stem)
+            profile_data = _load_profile(PROFILES_DIR / f"{profile_name}.toml")
+            if profile_data is None:
                 raise ValueError(
                     f"Unknown profile: {profile_name}. "
-                    f"Available profiles: {', '.join(sorted(available))}"
+                    f"Available profiles: {', '.join(list_profiles())}"
                 )
 
-        profile_data["profile"] = profile_name
-        profile_data.update(overrides)
-        return cls.from_dict(profile_data)
+        return cls.from_dict({**profile_data, "profile": profile_name, **overrides})
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -433,23 +432,18 @@ class OpenMedConfig:
         Returns:
             New OpenMedConfig with profile settings merged.
         """
-        # Start with current values
-        current = self.to_dict()
-
-        # Get profile settings
+        profile_data: Optional[Mapping[str, Any]]
         if profile_name in PROFILE_PRESETS:
-            profile_data = dict(PROFILE_PRESETS[profile_name])
+            profile_data = PROFILE_PRESETS[profile_name]
         else:
-            profile_path = PROFILES_DIR / f"{profile_name}.toml"
-            if profile_path.exists():
-                profile_data = _load_toml(profile_path)
-            else:
+            profile_data = _load_profile(PROFILES_DIR / f"{profile_name}.toml")
+            if profile_data is None:
                 raise ValueError(f"Unknown profile: {profile_name}")
 
-        # Merge profile into current (profile values override)
-        current.update(profile_data)
-        current["profile"] = profile_name
-        return OpenMedConfig.from_dict(current)
+        # Profile values override the current settings.
+        return OpenMedConfig.from_dict(
+            {**self.to_dict(), **profile_data, "profile": profile_name}
+        )
 
 
 # Global configuration instance
@@ -535,6 +529,26 @@ def _load_toml(path: Path) -> Dict[str, Any]:
     return data
 
 
+@lru_cache(maxsize=32)
+def _load_profile_snapshot(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a profile file once per on-disk version (path, mtime, size)."""
+    return _load_toml(Path(path))
+
+
+def _load_profile(profile_path: Path) -> Optional[Dict[str, Any]]:
+    """Return a fresh copy of a custom profile, or ``None`` if it is missing."""
+    try:
+        file_stat = profile_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    # Deep copy so nested tables and arrays are never shared with the cache.
+    return copy.deepcopy(
+        _load_profile_snapshot(
+            str(profile_path), file_stat.st_mtime_ns, file_stat.st_size
+        )
+    )
+
+
 def _dump_toml(data: Dict[str, Any]) -> str:
     lines = [
         "# OpenMed configuration file",
@@ -584,14 +598,22 @@ def list_profiles() -> List[str]:
     Returns:
         List of profile names.
     """
-    profiles = list(PROFILE_PRESETS.keys())
+    profiles = set(PROFILE_PRESETS)
 
-    # Add custom profiles from profiles directory
-    if PROFILES_DIR.exists():
-        for profile_path in PROFILES_DIR.glob("*.toml"):
-            profile_name = profile_path.stem
-            if profile_name not in profiles:
-                profiles.append(profile_name)
+    # Add custom profiles from profiles directory. normcase keeps the suffix
+    # match case-insensitive only on platforms whose filesystems are.
+    try:
+        with os.scandir(PROFILES_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    len(name) > 5
+                    and os.path.normcase(name).endswith(".toml")
+                    and entry.is_file()
+                ):
+                    profiles.add(name[:-5])
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     return sorted(profiles)
 
@@ -611,9 +633,9 @@ def get_profile(profile_name: str) -> Dict[str, Any]:
     if profile_name in PROFILE_PRESETS:
         return dict(PROFILE_PRESETS[profile_name])
 
-    profile_path = PROFILES_DIR / f"{profile_name}.toml"
-    if profile_path.exists():
-        return _load_toml(profile_path)
+    profile_data = _load_profile(PROFILES_DIR / f"{profile_name}.toml")
+    if profile_data is not None:
+        return profile_data
 
     raise ValueError(f"Unknown profile: {profile_name}")
 
@@ -631,15 +653,13 @@ def save_profile(profile_name: str, settings: Dict[str, Any]) -> Path:
     PROFILES_DIR.mkdir(parents=True, exist_ok=True)
     profile_path = PROFILES_DIR / f"{profile_name}.toml"
 
-    lines = [
-        f"# OpenMed profile: {profile_name}",
-        "# Custom profile configuration",
-        "",
-    ]
-    for key, value in settings.items():
-        lines.append(f"{key} = {_format_value(value)}")
-
-    profile_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with profile_path.open("w", encoding="utf-8") as handle:
+        handle.write(f"# OpenMed profile: {profile_name}\n")
+        handle.write("# Custom profile configuration\n\n")
+        for key, value in settings.items():
+            handle.write(f"{key} = {_format_value(value)}\n")
+    # A rewrite can keep the same size and, on coarse filesystems, mtime.
+    _load_profile_snapshot.cache_clear()
     return profile_path
 
 
@@ -661,6 +681,7 @@ def delete_profile(profile_name: str) -> bool:
     profile_path = PROFILES_DIR / f"{profile_name}.toml"
     if profile_path.exists():
         profile_path.unlink()
+        _load_profile_snapshot.cache_clear()
         return True
     return False
 
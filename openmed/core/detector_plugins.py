@@ -51,7 +51,6 @@ from __future__ import annotations
 
 import importlib.metadata as importlib_metadata
 import logging
-import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from importlib import import_module
@@ -244,7 +243,7 @@ def detect_indian_identifiers(
         key=lambda item: item.priority,
         reverse=True,
     ):
-        for match in re.finditer(pattern.pattern, text, pattern.flags):
+        for match in pattern.compiled.finditer(text):
             surface = match.group(0)
             if pattern.validator is not None and not pattern.validator(surface):
                 continue
@@ -252,7 +251,7 @@ def detect_indian_identifiers(
                 text,
                 match.start(),
                 match.end(),
-                pattern.context_words,
+                pattern.context_terms,
             )
             if pattern.safety_sweep_requires_context and not has_context:
                 continue
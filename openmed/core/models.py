@@ -2,12 +2,15 @@
 
 import gc
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from .capabilities import raise_missing_backend
+from .result_cache import bump_model_generation
 
 logger = logging.getLogger(__name__)
 
@@ -520,6 +523,7 @@ class ModelLoader:
             "pipelines": len(pipeline_keys),
         }
         if any(released[name] for name in ("models", "tokenizers", "pipelines")):
+            bump_model_generation()
             self._release_cached_memory()
         return released
 
@@ -534,6 +538,7 @@ class ModelLoader:
         self._tokenizers.clear()
         self._pipelines.clear()
         if any(released.values()):
+            bump_model_generation()
             self._release_cached_memory()
         return released
 
@@ -843,6 +848,75 @@ class ModelLoader:
                 )
 
 
+# Process-wide loaders reused by calls that do not pass their own loader, so
+# repeated ``analyze_text``/``extract_pii`` calls keep warmed models in memory
+# instead of re-running ``from_pretrained``. Loaders are keyed by the loader
+# class and the config's field values, so equal configs (including copies
+# unpickled in worker processes) share one loader. Entries hold a strong
+# reference to the loader class so its ``id`` cannot be recycled.
+_SHARED_LOADER_LIMIT = 4
+_SHARED_LOADERS: "OrderedDict[Tuple[int, Tuple[Any, ...]], Tuple[Any, Any, Any]]" = (
+    OrderedDict()
+)
+_SHARED_LOADERS_LOCK = threading.Lock()
+
+
+def _config_cache_key(config: "OpenMedConfig") -> Tuple[Any, ...]:
+    """Return a hashable snapshot of ``config``'s field values."""
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in config.to_dict().items()
+    )
+
+
+def _shared_model_loader(
+    config: Optional["OpenMedConfig"] = None,
+    loader_cls: Any = None,
+) -> "ModelLoader":
+    """Return the process-wide loader for ``config``, creating it on first use.
+
+    At most ``_SHARED_LOADER_LIMIT`` configurations are kept; the least
+    recently used loader is forgotten when a new configuration is added.
+    Evicted loaders are not unloaded explicitly, because another thread may
+    still be using one; they are freed once the last reference is dropped.
+
+    Args:
+        config: Configuration the loader is built with. ``None`` resolves to
+            the current global configuration.
+        loader_cls: Loader class to instantiate. Defaults to ``ModelLoader``.
+
+    Returns:
+        A loader shared by every caller using the same class and equal config
+        values.
+    """
+    loader_cls = ModelLoader if loader_cls is None else loader_cls
+    resolved = config if config is not None else get_config()
+    key = (id(loader_cls), _config_cache_key(resolved))
+    with _SHARED_LOADERS_LOCK:
+        entry = _SHARED_LOADERS.get(key)
+        if entry is not None:
+            _SHARED_LOADERS.move_to_end(key)
+            return entry[2]
+
+    loader = loader_cls(config)
+    with _SHARED_LOADERS_LOCK:
+        entry = _SHARED_LOADERS.setdefault(key, (loader_cls, resolved, loader))
+        _SHARED_LOADERS.move_to_end(key)
+        if len(_SHARED_LOADERS) > _SHARED_LOADER_LIMIT:
+            _SHARED_LOADERS.popitem(last=False)
+    return entry[2]
+
+
+def clear_shared_loaders() -> None:
+    """Unload and forget every process-wide loader."""
+    with _SHARED_LOADERS_LOCK:
+        loaders = [entry[2] for entry in _SHARED_LOADERS.values()]
+        _SHARED_LOADERS.clear()
+    for loader in loaders:
+        if hasattr(loader, "unload_all_models"):
+            loader.unload_all_models()
+
+
 # Convenience function for quick model loading
 def load_model(
     model_name: str, config: Optional["OpenMedConfig"] = None, **kwargs
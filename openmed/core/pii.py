@@ -24,16 +24,29 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
 import random
 import re
+import sys
+import time
 import unicodedata
 from bisect import bisect_left, bisect_right
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Literal, NoReturn, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Literal,
+    NoReturn,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from ..processing.outputs import EntityPrediction, PredictionResult
 from ..processing.text import InputError as InputError
@@ -41,7 +54,7 @@ from ..processing.text import validate_pii_input
 from .budget import BudgetClock, RequestBudget, coerce_budget
 from .capabilities import MissingOptionalDependencyError
 from .capabilities import install_hint as _optional_dependency_install_instruction
-from .config import OpenMedConfig
+from .config import OpenMedConfig, get_config
 from .custom_recognizer import (
     CUSTOM_DENY_DETECTOR,
     abdm_mode_enabled,
@@ -161,12 +174,20 @@ class PIIEntity(EntityPrediction):
     surrogate: Optional[str] = None
 
     def __post_init__(self):
-        """Initialize entity_type from label if not set."""
+        """Initialize entity_type from label if not set.
+
+        Labels come from a small fixed vocabulary, so they are interned to
+        share one string object across every entity of a category.
+        """
+        if isinstance(self.label, str):
+            self.label = sys.intern(self.label)
         if not self.entity_type:
             self.entity_type = self.label
+        elif isinstance(self.entity_type, str):
+            self.entity_type = sys.intern(self.entity_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeidentificationResult:
     """Result of de-identification operation.
 
@@ -190,6 +211,11 @@ class DeidentificationResult:
     metadata: Optional[dict[str, Any]] = None
     audit_report: Optional["AuditReport"] = None
 
+    def __post_init__(self):
+        """Intern the method name shared by every result of a run."""
+        if isinstance(self.method, str):
+            self.method = sys.intern(self.method)
+
     def to_dict(self) -> dict:
         """Convert result to dictionary format.
 
@@ -317,7 +343,32 @@ class DeidentificationResult:
 _ACCENT_NORMALIZE_LANGS = frozenset({"es"})
 _OCCURRENCE_MAPPING_PREFIX = "__openmed_occurrence_v1__:"
 
+# Result timestamps are cached per epoch second: batch pipelines build many
+# results per second, so re-reading the clock and re-formatting the ISO string
+# for each one is wasted work. Sub-second resolution is dropped on purpose.
+_TS_CACHE: list[Any] = [-1, datetime.fromtimestamp(0), ""]
+
+
+def _now() -> datetime:
+    """Return the current local time truncated to whole seconds."""
+    second = int(time.time())
+    if second != _TS_CACHE[0]:
+        stamp = datetime.fromtimestamp(second)
+        _TS_CACHE[:] = [second, stamp, stamp.isoformat()]
+    return _TS_CACHE[1]
+
+
+def _now_iso() -> str:
+    """Return :func:`_now` as an ISO-8601 string, formatted once per second."""
+    _now()
+    return _TS_CACHE[2]
+
+
 _DEFAULT_EN_MODEL = "OpenMed/OpenMed-PII-SuperClinical-Small-44M-v1"
+# Below these sizes process start-up and model loading cost more than the
+# parallel speed-up, so ``extract_pii_batch`` stays in-process.
+_PARALLEL_MIN_TEXTS = 32
+_PARALLEL_MIN_CHARS = 100_000
 _DAY_FIRST_LANGS = frozenset(
     {
         "fr",
@@ -340,6 +391,43 @@ _DAY_FIRST_LANGS = frozenset(
         "vi",
     }
 )
+
+_DIGIT_RE = re.compile(r"\d")
+# Numeric date shapes used by the date shifter, compiled once at import.
+_DMY_OR_MDY_DATE_RE = re.compile(r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})")
+_YMD_DATE_RE = re.compile(r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})")
+_DOTTED_DMY_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})")
+# Per-convention (pattern, field order) candidates for ``_shift_date_basic``.
+_BASIC_DATE_PATTERNS: dict[str, tuple[tuple[re.Pattern[str], str], ...]] = {
+    # European: DD/MM/YYYY first
+    "day_first": ((_DMY_OR_MDY_DATE_RE, "dmy"), (_YMD_DATE_RE, "ymd")),
+    # German: DD.MM.YYYY
+    "de": (
+        (_DOTTED_DMY_DATE_RE, "dmy"),
+        (_DMY_OR_MDY_DATE_RE, "dmy"),
+        (_YMD_DATE_RE, "ymd"),
+    ),
+    # Japanese: YYYY/MM/DD (kanji-form 年月日 is handled by the
+    # JAPANESE_PII_PATTERNS regex, not here).
+    "ja": ((_YMD_DATE_RE, "ymd"), (_DMY_OR_MDY_DATE_RE, "dmy")),
+    # US/English: MM/DD/YYYY first
+    "default": (
+        (_DMY_OR_MDY_DATE_RE, "mdy"),
+        (_YMD_DATE_RE, "ymd"),
+        (_DMY_OR_MDY_DATE_RE, "dmy"),
+    ),
+}
+# Fully numeric dates with a four-digit year that the shifter handles without
+# dateutil: DD/MM/YYYY-style (consistent separator) and ISO YYYY-MM-DD.
+_NUMERIC_DATE_RE = re.compile(r"(\d{1,2})([/.\-])(\d{1,2})\2(\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_ISO_DATE_SHAPE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DOTTED_DATE_SHAPE_RE = re.compile(r"\d{1,2}\.\d{1,2}\.\d{2,4}")
+_SLASH_DATE_SHAPE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+_DASH_DATE_SHAPE_RE = re.compile(r"\d{1,2}-\d{1,2}-\d{2,4}")
+_DAY_MONTH_YEAR_SHAPE_RE = re.compile(r"\d+\.?\s+[^\W\d_]+\s+\d{4}")
+_DAY_DE_MONTH_DE_YEAR_SHAPE_RE = re.compile(r"\d+\s+de\s+[^\W\d_]+\s+de\s+\d{4}")
+_MONTH_DAY_YEAR_SHAPE_RE = re.compile(r"[^\W\d_]+\s+\d+,?\s+\d{4}")
 _PRIVACY_FILTER_FAMILY_ALIASES = frozenset({"openai-privacy-filter", "privacy-filter"})
 
 # Repository-prefix allowlist for org/model identifiers that route through the
@@ -462,7 +550,7 @@ def _prediction_result_from_privacy_filter_raw(
         text=original_text if do_normalize else text,
         entities=entities,
         model_name=model_name,
-        timestamp=datetime.now().isoformat(),
+        timestamp=_now_iso(),
     )
 
 
@@ -1489,6 +1577,174 @@ def extract_pii(
     return final_result
 
 
+def extract_pii_batch(
+    texts: Sequence[str | bytes | bytearray | memoryview],
+    model_name: str = _DEFAULT_EN_MODEL,
+    confidence_threshold: float = 0.5,
+    config: Optional[OpenMedConfig] = None,
+    use_smart_merging: bool = True,
+    lang: str = "en",
+    normalize_accents: Optional[bool] = None,
+    *,
+    preserve_whitespace: bool = False,
+    locale: Optional[str] = None,
+    loader: Optional["ModelLoader"] = None,
+    batch_size: Optional[int] = None,
+    num_workers: Optional[int] = None,
+    custom_recognizer: Any = None,
+    abdm: Optional[bool] = None,
+    budget: Optional[RequestBudget] = None,
+    max_processes: Optional[int] = None,
+) -> list[PredictionResult]:
+    """Extract PII entities from several texts with shared backend resources.
+
+    All texts share one model loader, and backends that accept a list of
+    inputs (such as the privacy-filter pipeline) receive them in a single
+    call. Texts are submitted longest first so padded batches group inputs of
+    similar length; results are returned in the original input order.
+
+    With ``max_processes`` above one, large corpora (more than 32 texts and
+    100,000 characters) are split into chunks of similar character count and
+    processed by a pool of worker processes, each loading the model once.
+    Calls passing a ``loader`` or ``budget`` always run in-process because
+    neither can be shared across processes. Workers are always started with
+    the ``spawn`` method, so scripts using ``max_processes`` must guard their
+    entry point with ``if __name__ == "__main__":``.
+
+    Per-text options of :func:`extract_pii` are not accepted here: the
+    code-mixed route (``code_mixed``, ``token_language_tags``, ``lid_model``
+    and ``transliterated_name_config``) requires a single input text, and
+    result caching (``cache_results``, ``max_cache_entries``) is per call.
+    Call :func:`extract_pii` for each text that needs them.
+
+    Args:
+        texts: Input texts to analyze.
+        model_name: PII detection model (registry key or HuggingFace ID).
+        confidence_threshold: Minimum confidence score (0-1).
+        config: Optional configuration override.
+        use_smart_merging: Enable regex-based semantic unit merging.
+        lang: ISO 639-1 language code shared by every text.
+        normalize_accents: Strip diacritical marks before model inference.
+        preserve_whitespace: Preserve leading and trailing source whitespace.
+        locale: Optional locale used for locale-specific recognizers.
+        loader: Optional shared model loader to reuse warmed pipelines.
+        batch_size: Optional backend inference batch size.
+        num_workers: Optional backend inference worker count.
+        custom_recognizer: Optional deny-list/allow-list recognizer config.
+        abdm: Enable the India ABDM identifier bundle.
+        budget: Optional request budget applied across the whole batch.
+        max_processes: Optional worker process count for large corpora.
+            ``None`` (the default) keeps inference in the calling process.
+
+    Returns:
+        One PredictionResult per input text, in input order.
+
+    Example:
+        >>> from openmed.core.pii import extract_pii_batch
+        >>> extract_pii_batch([])
+        []
+    """
+    validated = [validate_pii_input(text) for text in texts]
+    resolved_budget = coerce_budget(budget)
+    runtime_kwargs = {}
+    if batch_size is not None:
+        runtime_kwargs["batch_size"] = batch_size
+    if num_workers is not None:
+        runtime_kwargs["num_workers"] = num_workers
+    if max_processes is not None and max_processes < 1:
+        raise ValueError("max_processes must be a positive integer")
+    batch_kwargs: dict[str, Any] = dict(
+        model_name=model_name,
+        confidence_threshold=confidence_threshold,
+        config=config,
+        use_smart_merging=use_smart_merging,
+        lang=lang,
+        normalize_accents=normalize_accents,
+        preserve_whitespace=preserve_whitespace,
+        locale=locale,
+        custom_recognizer=custom_recognizer,
+        abdm=abdm,
+        **runtime_kwargs,
+    )
+
+    results: list[Any] = [None] * len(validated)
+    if (
+        max_processes is not None
+        and max_processes > 1
+        and loader is None
+        and resolved_budget is None
+        and len(validated) > _PARALLEL_MIN_TEXTS
+        and sum(map(len, validated)) > _PARALLEL_MIN_CHARS
+    ):
+        # Spawned workers do not inherit set_config(), so send the parent's
+        # effective config with every chunk.
+        chunk_kwargs = {
+            **batch_kwargs,
+            "config": config if config is not None else get_config(),
+        }
+        chunks = _balanced_chunks([len(text) for text in validated], max_processes)
+        # Always spawn: forking a parent that already holds a warmed shared
+        # loader (torch or tokenizer threads) can deadlock the workers.
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            chunk_results = executor.map(
+                _extract_pii_chunk,
+                [[validated[index] for index in chunk] for chunk in chunks],
+                [chunk_kwargs] * len(chunks),
+            )
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                for index, result in zip(chunk, chunk_result):
+                    results[index] = result
+        return results
+
+    budget_clock = resolved_budget.start() if resolved_budget is not None else None
+    order = sorted(
+        range(len(validated)),
+        key=lambda index: len(validated[index]),
+        reverse=True,
+    )
+    sorted_results = _extract_pii_batch(
+        [validated[index] for index in order],
+        loader=loader,
+        budget_clock=budget_clock,
+        **batch_kwargs,
+    )
+    for index, result in zip(order, sorted_results):
+        results[index] = result
+    return results
+
+
+def _balanced_chunks(lengths: Sequence[int], count: int) -> list[list[int]]:
+    """Split indices into at most ``count`` chunks of similar total length.
+
+    Indices are assigned longest first to the currently lightest chunk, and
+    each chunk keeps its indices in descending length order so the worker
+    batches inputs of similar size together.
+    """
+    order = sorted(range(len(lengths)), key=lambda index: lengths[index], reverse=True)
+    chunks: list[list[int]] = [[] for _ in range(min(count, len(lengths)))]
+    totals = [0] * len(chunks)
+    for index in order:
+        target = totals.index(min(totals))
+        chunks[target].append(index)
+        totals[target] += lengths[index]
+    return [chunk for chunk in chunks if chunk]
+
+
+def _extract_pii_chunk(
+    texts: list[str], batch_kwargs: dict[str, Any]
+) -> list[PredictionResult]:
+    """Worker entry point for ``extract_pii_batch`` process pools."""
+    from .models import HF_AVAILABLE, _shared_model_loader
+
+    loader = None
+    if HF_AVAILABLE:
+        loader = _shared_model_loader(batch_kwargs.get("config"))
+    return _extract_pii_batch(texts, loader=loader, **batch_kwargs)
+
+
 def _resolve_deidentification_method(
     method: DeidentificationMethod,
     shift_dates: Optional[bool],
@@ -2077,6 +2333,29 @@ def _build_deidentification_result(
         list(pii_result.entities),
     )
     resolved_entities = resolve_overlapping_entities(grapheme_safe_entities)
+
+    if effective_method == "shift_dates":
+        date_shift_days = _resolve_date_shift_days(
+            date_shift_days=date_shift_days,
+            patient_key=patient_key,
+            date_shift_max_days=date_shift_max_days,
+            date_shift_secret=date_shift_secret,
+            seed=seed,
+        )
+
+    if not resolved_entities and not audit:
+        # Clean text: nothing to redact, so skip the entity, anonymizer, and
+        # splice machinery and hand back the input string itself.
+        return DeidentificationResult(
+            original_text=text,
+            deidentified_text=text,
+            pii_entities=[],
+            method=effective_method,
+            timestamp=_now(),
+            mapping={} if keep_mapping else None,
+            metadata=_copy_metadata(getattr(pii_result, "metadata", None)),
+        )
+
     pii_result = _replace_analysis_result(pii_result, entities=resolved_entities)
 
     active_thresholds = _active_calibration_thresholds(pii_result, lang=lang)
@@ -2112,15 +2391,6 @@ def _build_deidentification_result(
 
     redaction_entities = sorted(pii_entities, key=lambda e: e.start, reverse=True)
 
-    if effective_method == "shift_dates":
-        date_shift_days = _resolve_date_shift_days(
-            date_shift_days=date_shift_days,
-            patient_key=patient_key,
-            date_shift_max_days=date_shift_max_days,
-            date_shift_secret=date_shift_secret,
-            seed=seed,
-        )
-
     anonymizer = None
     if effective_method in {"replace", "format_preserve"} or any(
         _entity_policy_action(entity) in {"replace", "format_preserve"}
@@ -2157,7 +2427,7 @@ def _build_deidentification_result(
             ),
         )
 
-    deidentified = text
+    splices: list[tuple[int, int, str]] = []
     mapping: dict[str, str] | None = None
     mapping_occurrences: dict[str, list[tuple[int, str]]] = {}
     source_surrogates: dict[tuple[str, str], str] = {}
@@ -2245,15 +2515,24 @@ def _build_deidentification_result(
         entity.action = actual_entity_method
         entity.surrogate = redacted if redacted else None
 
-        deidentified = (
-            deidentified[: entity.start] + redacted + deidentified[entity.end :]
-        )
+        splices.append((entity.start, entity.end, redacted))
 
         if keep_mapping:
             mapping_occurrences.setdefault(redacted, []).append(
                 (entity.start, entity.original_text or entity.text)
             )
 
+    # Stitch the kept text and surrogates together in one left-to-right pass
+    # instead of re-slicing the whole note once per entity.
+    parts: list[str] = []
+    cursor = 0
+    for start, end, redacted in reversed(splices):
+        parts.append(text[cursor:start])
+        parts.append(redacted)
+        cursor = end
+    parts.append(text[cursor:])
+    deidentified = "".join(parts)
+
     if keep_mapping:
         mapping = _build_reidentification_mapping(mapping_occurrences)
 
@@ -2282,7 +2561,7 @@ def _build_deidentification_result(
         deidentified_text=deidentified,
         pii_entities=pii_entities,
         method=effective_method,
-        timestamp=datetime.now(),
+        timestamp=_now(),
         mapping=mapping,
         metadata=_copy_metadata(getattr(pii_result, "metadata", None)),
         audit_report=audit_report,
@@ -2824,118 +3103,172 @@ def _redact_entity(
     Returns:
         Redacted text replacement
     """
-    if method == "mask":
-        # Replace with placeholder
-        return _mask_placeholder(entity)
+    redactor = _REDACTORS.get(method)
+    if redactor is None:
+        return entity.text
+    return redactor(
+        entity,
+        keep_year=keep_year,
+        date_shift_days=date_shift_days,
+        lang=lang,
+        anonymizer=anonymizer,
+        require_dateutil=require_dateutil,
+        surrogate_vault=surrogate_vault,
+    )
 
-    elif method == "aadhaar_mask":
-        original = entity.original_text or entity.text
-        from .pii_i18n import validate_aadhaar
 
-        if validate_aadhaar(original):
-            from .anonymizer.format_preserve import mask_aadhaar
+def _redact_mask(entity: PIIEntity, **_: Any) -> str:
+    # Replace with placeholder
+    return _mask_placeholder(entity)
 
-            return mask_aadhaar(original)
-        return _mask_placeholder(entity)
 
-    elif method == "remove":
-        # Remove entirely (replace with empty string)
-        return ""
+def _redact_aadhaar_mask(entity: PIIEntity, **_: Any) -> str:
+    original = entity.original_text or entity.text
+    from .pii_i18n import validate_aadhaar
 
-    elif method == "replace":
-        if anonymizer is not None:
-            original = entity.original_text or entity.text
-            surrogate_label = (
-                "OTHER" if _is_mixed_label_union(entity) else entity.entity_type
-            )
-            if surrogate_vault is not None:
-                label = (
-                    "OTHER"
-                    if _is_mixed_label_union(entity)
-                    else entity.canonical_label or entity.entity_type
-                )
+    if validate_aadhaar(original):
+        from .anonymizer.format_preserve import mask_aadhaar
 
-                def _create_surrogate(attempt: int) -> str:
-                    key = surrogate_vault.key_for(
-                        original,
-                        label=label,
-                        lang=lang,
-                    )
-                    if key.lang == "indic":
-                        return anonymizer.surrogate_identity(
-                            original,
-                            surrogate_label,
-                            lang=lang,
-                            attempt=attempt,
-                        )
-                    source = original if attempt == 0 else f"{original}|{attempt}"
-                    return anonymizer.surrogate(source, surrogate_label, lang=lang)
-
-                key = surrogate_vault.key_for(
-                    original,
-                    label=label,
-                    lang=lang,
-                )
-                render_surrogate = None
-                if key.lang == "indic":
-                    render_surrogate = lambda identity: (
-                        anonymizer.render_name_surrogate(
-                            identity,
-                            source_surface=original,
-                        )
-                    )
+        return mask_aadhaar(original)
+    return _mask_placeholder(entity)
 
-                return surrogate_vault.get_or_create(
-                    original,
-                    label=label,
-                    lang=lang,
-                    create_surrogate=_create_surrogate,
-                    required_script=_surrogate_script_constraint(entity),
-                    render_surrogate=render_surrogate,
-                )
-            return anonymizer.surrogate(
+
+def _redact_remove(entity: PIIEntity, **_: Any) -> str:
+    # Remove entirely (replace with empty string)
+    return ""
+
+
+def _redact_replace(
+    entity: PIIEntity,
+    *,
+    lang: str,
+    anonymizer: Optional["Anonymizer"],
+    surrogate_vault: Optional["SurrogateVault"],
+    **_: Any,
+) -> str:
+    if anonymizer is None:
+        return _generate_fake_pii(entity.entity_type, lang=lang)
+
+    original = entity.original_text or entity.text
+    surrogate_label = "OTHER" if _is_mixed_label_union(entity) else entity.entity_type
+    if surrogate_vault is None:
+        return anonymizer.surrogate(
+            original,
+            surrogate_label,
+            lang=lang,
+        )
+
+    label = (
+        "OTHER"
+        if _is_mixed_label_union(entity)
+        else entity.canonical_label or entity.entity_type
+    )
+
+    def _create_surrogate(attempt: int) -> str:
+        key = surrogate_vault.key_for(
+            original,
+            label=label,
+            lang=lang,
+        )
+        if key.lang == "indic":
+            return anonymizer.surrogate_identity(
                 original,
                 surrogate_label,
                 lang=lang,
+                attempt=attempt,
             )
-        return _generate_fake_pii(entity.entity_type, lang=lang)
+        source = original if attempt == 0 else f"{original}|{attempt}"
+        return anonymizer.surrogate(source, surrogate_label, lang=lang)
 
-    elif method == "format_preserve":
-        if _is_mixed_label_union(entity):
-            return _mask_placeholder(entity)
-        if anonymizer is not None:
-            surrogate = anonymizer.format_preserving_surrogate(
-                entity.original_text or entity.text,
-                entity.entity_type,
-                lang=lang,
+    key = surrogate_vault.key_for(
+        original,
+        label=label,
+        lang=lang,
+    )
+    render_surrogate = None
+    if key.lang == "indic":
+
+        def _render_indic_surrogate(identity):
+            return anonymizer.render_name_surrogate(
+                identity,
+                source_surface=original,
             )
-            if surrogate is not None:
-                return surrogate
+
+        render_surrogate = _render_indic_surrogate
+
+    return surrogate_vault.get_or_create(
+        original,
+        label=label,
+        lang=lang,
+        create_surrogate=_create_surrogate,
+        required_script=_surrogate_script_constraint(entity),
+        render_surrogate=render_surrogate,
+    )
+
+
+def _redact_format_preserve(
+    entity: PIIEntity,
+    *,
+    lang: str,
+    anonymizer: Optional["Anonymizer"],
+    **_: Any,
+) -> str:
+    if _is_mixed_label_union(entity):
         return _mask_placeholder(entity)
+    if anonymizer is not None:
+        surrogate = anonymizer.format_preserving_surrogate(
+            entity.original_text or entity.text,
+            entity.entity_type,
+            lang=lang,
+        )
+        if surrogate is not None:
+            return surrogate
+    return _mask_placeholder(entity)
 
-    elif method == "hash":
-        # Generate consistent hash
-        hash_val = hashlib.sha256(entity.text.encode()).hexdigest()[:8]
-        entity.hash_value = hash_val
-        return f"{entity.entity_type}_{hash_val}"
-
-    elif method == "shift_dates":
-        # Shift dates by offset
-        if _is_mixed_label_union(entity):
-            return _mask_placeholder(entity)
-        if _is_date_entity(entity, lang) and date_shift_days is not None:
-            return _shift_date(
-                entity.text,
-                date_shift_days,
-                keep_year,
-                lang=lang,
-                require_dateutil=require_dateutil,
-            )
-        else:
-            # Non-date entities get masked
-            return _mask_placeholder(entity)
 
-    return entity.text
+def _redact_hash(entity: PIIEntity, **_: Any) -> str:
+    # Generate consistent hash. Only the first four digest bytes are
+    # rendered, which matches the historical hexdigest()[:8] tags.
+    hash_val = hashlib.sha256(entity.text.encode()).digest()[:4].hex()
+    entity.hash_value = hash_val
+    return f"{entity.entity_type}_{hash_val}"
+
+
+def _redact_shift_dates(
+    entity: PIIEntity,
+    *,
+    keep_year: bool,
+    date_shift_days: Optional[int],
+    lang: str,
+    require_dateutil: bool,
+    **_: Any,
+) -> str:
+    # Shift dates by offset
+    if _is_mixed_label_union(entity):
+        return _mask_placeholder(entity)
+    if _is_date_entity(entity, lang) and date_shift_days is not None:
+        return _shift_date(
+            entity.text,
+            date_shift_days,
+            keep_year,
+            lang=lang,
+            require_dateutil=require_dateutil,
+        )
+    # Non-date entities get masked
+    return _mask_placeholder(entity)
+
+
+# Per-method redactors, looked up once per entity instead of walking an
+# if/elif chain of string comparisons.
+_REDACTORS: dict[str, Callable[..., str]] = {
+    "mask": _redact_mask,
+    "aadhaar_mask": _redact_aadhaar_mask,
+    "remove": _redact_remove,
+    "replace": _redact_replace,
+    "format_preserve": _redact_format_preserve,
+    "hash": _redact_hash,
+    "shift_dates": _redact_shift_dates,
+}
 
 
 def _surrogate_script_constraint(entity: PIIEntity) -> Optional[str]:
@@ -3082,20 +3415,33 @@ def _generate_fake_pii(entity_type: str, lang: str = "en") -> str:
     Returns:
         Fake replacement text
     """
+    pool = _fake_data_pool(entity_type, lang)
+    if pool:
+        return random.choice(pool)
+    return f"[{entity_type}]"
+
+
+@lru_cache(maxsize=1024)
+def _fake_data_pool(entity_type: str, lang: str) -> tuple[str, ...]:
+    """Resolve the fake-data pool for ``(entity_type, lang)`` once.
+
+    Replacement runs once per entity (or per structured cell), and the same
+    handful of labels repeat throughout a document, so the label-key lookup and
+    English fallback are cached and only the random draw is paid per entity.
+    Pools are frozen to tuples so the cached value cannot alias the mutable
+    lists in ``LANGUAGE_FAKE_DATA``. An empty pool means the label has no fake
+    data in any language.
+    """
     from .pii_i18n import LANGUAGE_FAKE_DATA
 
     fake_data = LANGUAGE_FAKE_DATA.get(lang, LANGUAGE_FAKE_DATA["en"])
     key = _resolve_fake_data_key(entity_type, lang)
 
     if key in fake_data:
-        return random.choice(fake_data[key])
+        return tuple(fake_data[key])
 
     # Fall back to English if the entity type isn't in the language-specific data
-    en_data = LANGUAGE_FAKE_DATA["en"]
-    if key in en_data:
-        return random.choice(en_data[key])
-
-    return f"[{entity_type}]"
+    return tuple(LANGUAGE_FAKE_DATA["en"].get(key, ()))
 
 
 def _parse_localized_month_date(
@@ -3103,6 +3449,45 @@ def _parse_localized_month_date(
     lang: str,
 ) -> tuple[datetime, str] | None:
     """Parse localized month-name dates that dateutil may not understand."""
+    compiled = _localized_month_date_patterns(lang)
+    if compiled is None:
+        return None
+    patterns, month_lookup = compiled
+    text = date_str.strip()
+
+    match = None
+    style = ""
+    for pattern, candidate_style in patterns:
+        match = pattern.match(text)
+        if match:
+            style = candidate_style
+            break
+    if match is None:
+        return None
+
+    month = month_lookup.get(match.group("month").casefold())
+    if month is None:
+        return None
+
+    try:
+        parsed = datetime(
+            int(match.group("year")),
+            month,
+            int(match.group("day")),
+        )
+    except ValueError:
+        return None
+
+    if lang == "de" and match.groupdict().get("dot"):
+        style = "day_month_year_dot"
+    return parsed, style
+
+
+@lru_cache(maxsize=64)
+def _localized_month_date_patterns(
+    lang: str,
+) -> tuple[tuple[tuple[re.Pattern[str], str], ...], dict[str, int]] | None:
+    """Compile the month-name date patterns and month lookup for ``lang``."""
     from .pii_i18n import LANGUAGE_MONTH_NAMES
 
     month_names = LANGUAGE_MONTH_NAMES.get(lang)
@@ -3110,8 +3495,6 @@ def _parse_localized_month_date(
         return None
 
     month_alts = "|".join(re.escape(name) for name in month_names)
-    text = date_str.strip()
-
     if lang in {"es", "pt"}:
         patterns = [
             (
@@ -3138,36 +3521,25 @@ def _parse_localized_month_date(
             ),
         ]
 
-    match = None
-    style = ""
-    for pattern, candidate_style in patterns:
-        match = re.match(pattern, text, re.IGNORECASE)
-        if match:
-            style = candidate_style
-            break
-    if match is None:
-        return None
-
     month_lookup = {
         name.casefold(): index + 1 for index, name in enumerate(month_names)
     }
-    month_name = match.group("month").casefold()
-    month = month_lookup.get(month_name)
-    if month is None:
-        return None
+    compiled = tuple(
+        (re.compile(pattern, re.IGNORECASE), style) for pattern, style in patterns
+    )
+    return compiled, month_lookup
 
-    try:
-        parsed = datetime(
-            int(match.group("year")),
-            month,
-            int(match.group("day")),
-        )
-    except ValueError:
-        return None
 
-    if lang == "de" and match.groupdict().get("dot"):
-        style = "day_month_year_dot"
-    return parsed, style
+@lru_cache(maxsize=1)
+def _all_month_names_lower() -> tuple[str, ...]:
+    """Return every localized month name, lowercased, in language order."""
+    from .pii_i18n import LANGUAGE_MONTH_NAMES
+
+    return tuple(
+        month.lower()
+        for month_list in LANGUAGE_MONTH_NAMES.values()
+        for month in month_list
+    )
 
 
 def _format_localized_month_date(
@@ -3191,7 +3563,10 @@ def _format_localized_month_date(
     return f"{new_date.day} {month_name} {new_date.year}"
 
 
-def _replace_year_safe(date_value: datetime, year: int) -> datetime:
+_DateT = TypeVar("_DateT", bound=date)
+
+
+def _replace_year_safe(date_value: _DateT, year: int) -> _DateT:
     """Return ``date_value`` with its year set to ``year``.
 
     ``datetime.replace(year=...)`` raises ``ValueError`` for Feb 29 when the
@@ -3323,6 +3698,11 @@ def _shift_date(
     Returns:
         Shifted date string in the same format as input
     """
+    # Spans without a single digit cannot be anchored to a real date; dateutil
+    # would only fill them in from today's date ("Monday", "January").
+    if _DIGIT_RE.search(date_str) is None:
+        return "[DATE_SHIFTED]"
+
     localized = _parse_localized_month_date(date_str, lang)
     if localized is not None:
         try:
@@ -3351,6 +3731,10 @@ def _shift_date(
         # Fallback without dateutil - basic pattern matching
         return _shift_date_basic(date_str, shift_days, keep_year, lang=lang)
 
+    numeric = _shift_numeric_date(date_str, shift_days, keep_year, lang)
+    if numeric is not None:
+        return numeric
+
     try:
         # For European languages, try day-first parsing
         dayfirst = lang in _DAY_FIRST_LANGS
@@ -3372,6 +3756,59 @@ def _shift_date(
         return "[DATE_SHIFTED]"
 
 
+def _shift_numeric_date(
+    date_str: str,
+    shift_days: int,
+    keep_year: bool,
+    lang: str,
+) -> str | None:
+    """Shift an all-numeric date with integer day-ordinal arithmetic.
+
+    Covers the common ``MM/DD/YYYY``, ``DD.MM.YYYY``, ``DD-MM-YYYY`` and ISO
+    shapes without a dateutil parse, and renders them exactly as the dateutil
+    path would via ``_format_date_like_original``. Returns ``None`` when the
+    string is not one of those shapes or when the language-preferred reading
+    is not a valid date, so dateutil can apply its own disambiguation.
+    """
+    stripped = date_str.strip()
+    # dateutil reads ISO dates as year-day-month under dayfirst=True, so those
+    # languages keep going through dateutil to preserve their output.
+    iso = None if lang in _DAY_FIRST_LANGS else _ISO_DATE_RE.fullmatch(stripped)
+    if iso is not None:
+        year, month, day = int(iso[1]), int(iso[2]), int(iso[3])
+        separator = "-"
+    else:
+        numeric = _NUMERIC_DATE_RE.fullmatch(stripped)
+        if numeric is None:
+            return None
+        first, separator, second = int(numeric[1]), numeric[2], int(numeric[3])
+        year = int(numeric[4])
+        if lang in _DAY_FIRST_LANGS:
+            day, month = first, second
+        else:
+            month, day = first, second
+
+    try:
+        ordinal = date(year, month, day).toordinal()
+    except ValueError:
+        return None
+    try:
+        shifted = date.fromordinal(ordinal + shift_days)
+    except (ValueError, OverflowError):
+        return "[DATE_SHIFTED]"
+    if keep_year:
+        shifted = _replace_year_safe(shifted, year)
+
+    if iso is not None:
+        return f"{shifted.year}-{shifted.month:02d}-{shifted.day:02d}"
+    # Dotted dates always render day-first, matching _format_date_like_original.
+    if separator == "." or lang in _DAY_FIRST_LANGS:
+        leading, middle = shifted.day, shifted.month
+    else:
+        leading, middle = shifted.month, shifted.day
+    return f"{leading:02d}{separator}{middle:02d}{separator}{shifted.year}"
+
+
 def _shift_date_basic(
     date_str: str,
     shift_days: int,
@@ -3392,36 +3829,16 @@ def _shift_date_basic(
         Shifted date string or placeholder
     """
     # Order patterns based on language convention
-    if lang in _DAY_FIRST_LANGS - {"de"}:
-        # European: DD/MM/YYYY first
-        patterns = [
-            (r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})", "dmy"),
-            (r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})", "ymd"),
-        ]
-    elif lang == "de":
-        # German: DD.MM.YYYY
-        patterns = [
-            (r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})", "dmy"),
-            (r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})", "dmy"),
-            (r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})", "ymd"),
-        ]
-    elif lang == "ja":
-        # Japanese: YYYY/MM/DD (kanji-form 年月日 is handled by the
-        # JAPANESE_PII_PATTERNS regex, not here).
-        patterns = [
-            (r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})", "ymd"),
-            (r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})", "dmy"),
-        ]
+    if lang == "de" or lang == "ja":
+        patterns = _BASIC_DATE_PATTERNS[lang]
+    elif lang in _DAY_FIRST_LANGS:
+        patterns = _BASIC_DATE_PATTERNS["day_first"]
     else:
-        # US/English: MM/DD/YYYY first
-        patterns = [
-            (r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})", "mdy"),
-            (r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})", "ymd"),
-            (r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})", "dmy"),
-        ]
+        patterns = _BASIC_DATE_PATTERNS["default"]
 
+    stripped = date_str.strip()
     for pattern, order in patterns:
-        match = re.match(pattern, date_str.strip())
+        match = pattern.match(stripped)
         if match:
             groups = match.groups()
             try:
@@ -3494,15 +3911,15 @@ def _format_date_like_original(
     original_stripped = original.strip()
 
     # ISO format: YYYY-MM-DD
-    if re.match(r"\d{4}-\d{2}-\d{2}", original_stripped):
+    if _ISO_DATE_SHAPE_RE.match(original_stripped):
         return new_date.strftime("%Y-%m-%d")
 
     # German dot-separated: DD.MM.YYYY
-    if re.match(r"\d{1,2}\.\d{1,2}\.\d{2,4}", original_stripped):
+    if _DOTTED_DATE_SHAPE_RE.match(original_stripped):
         return new_date.strftime("%d.%m.%Y")
 
     # Slash-separated dates: interpretation depends on language
-    if re.match(r"\d{1,2}/\d{1,2}/\d{2,4}", original_stripped):
+    if _SLASH_DATE_SHAPE_RE.match(original_stripped):
         if lang in _DAY_FIRST_LANGS:
             # European: DD/MM/YYYY
             return new_date.strftime("%d/%m/%Y")
@@ -3511,32 +3928,26 @@ def _format_date_like_original(
             return new_date.strftime("%m/%d/%Y")
 
     # Dash-separated dates
-    if re.match(r"\d{1,2}-\d{1,2}-\d{2,4}", original_stripped):
+    if _DASH_DATE_SHAPE_RE.match(original_stripped):
         if lang in _DAY_FIRST_LANGS:
             return new_date.strftime("%d-%m-%Y")
         else:
             return new_date.strftime("%m-%d-%Y")
 
     # Month name formats - check all supported languages
-    month_names_flat = []
-    for month_list in LANGUAGE_MONTH_NAMES.values():
-        month_names_flat.extend(m.lower() for m in month_list)
-
     original_lower = original_stripped.lower()
-    for month in month_names_flat:
+    for month in _all_month_names_lower():
         if month in original_lower:
             # Use language-specific month name
             lang_months = LANGUAGE_MONTH_NAMES.get(lang, LANGUAGE_MONTH_NAMES["en"])
             month_name = lang_months[new_date.month - 1]
 
             # "15 januari 2020" / "15. Januar 2020" / localized day-month-year
-            if re.match(r"\d+\.?\s+[^\W\d_]+\s+\d{4}", original_stripped, re.UNICODE):
+            if _DAY_MONTH_YEAR_SHAPE_RE.match(original_stripped):
                 return f"{new_date.day} {month_name} {new_date.year}"
-            if re.match(
-                r"\d+\s+de\s+[^\W\d_]+\s+de\s+\d{4}", original_stripped, re.UNICODE
-            ):
+            if _DAY_DE_MONTH_DE_YEAR_SHAPE_RE.match(original_stripped):
                 return f"{new_date.day} de {month_name} de {new_date.year}"
-            if re.match(r"[^\W\d_]+\s+\d+,?\s+\d{4}", original_stripped, re.UNICODE):
+            if _MONTH_DAY_YEAR_SHAPE_RE.match(original_stripped):
                 return f"{month_name} {new_date.day}, {new_date.year}"
             break
 
@@ -3584,24 +3995,43 @@ def reidentify(
         ordinal, surface = parsed
         occurrence_mapping.setdefault(surface, []).append((ordinal, original))
 
-    for redacted in sorted(occurrence_mapping, key=len, reverse=True):
-        originals = [original for _, original in sorted(occurrence_mapping[redacted])]
-        occurrence_index = 0
+    occurrence_originals = {
+        surface: [original for _, original in sorted(entries)]
+        for surface, entries in occurrence_mapping.items()
+    }
+    occurrence_positions = dict.fromkeys(occurrence_originals, 0)
+
+    def restore(match: re.Match[str]) -> str:
+        redacted = match.group(0)
+        originals = occurrence_originals.get(redacted)
+        if originals is not None:
+            position = occurrence_positions[redacted]
+            if position < len(originals):
+                occurrence_positions[redacted] = position + 1
+                return originals[position]
+        return regular_mapping.get(redacted, redacted)
+
+    # Occurrence-aware surfaces and plain placeholders share one alternation,
+    # so the text is scanned once and restored values are never rescanned.
+    redacted_values = frozenset(key for key in regular_mapping if key).union(
+        occurrence_originals
+    )
+    if redacted_values:
+        pattern = _reidentification_pattern(redacted_values)
+        result = pattern.sub(restore, result)
 
-        def restore_occurrence(match: re.Match[str]) -> str:
-            nonlocal occurrence_index
-            if occurrence_index >= len(originals):
-                return match.group(0)
-            original = originals[occurrence_index]
-            occurrence_index += 1
-            return original
+    return result
 
-        result = re.sub(re.escape(redacted), restore_occurrence, result)
 
-    for redacted, original in regular_mapping.items():
-        result = result.replace(redacted, original)
+@lru_cache(maxsize=256)
+def _reidentification_pattern(redacted_values: frozenset[str]) -> re.Pattern[str]:
+    """Compile one alternation that restores every placeholder in a single scan.
 
-    return result
+    Alternatives are ordered longest first so a placeholder that is a prefix
+    of another (``"Sam"`` vs ``"Sam Lee"``) cannot shadow the longer match.
+    """
+    ordered = sorted(redacted_values, key=lambda value: (-len(value), value))
+    return re.compile("|".join(re.escape(value) for value in ordered))
 
 
 def _build_reidentification_mapping(
@@ -20,8 +20,12 @@ Example:
 from __future__ import annotations
 
 import re
+import sys
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .africa_context import rendered_pattern_entries
 
@@ -68,12 +72,49 @@ class PIIPattern:
     safety_sweep_requires_context: bool = False
     reject_on_validation_failure: bool = False
 
+    def __post_init__(self) -> None:
+        """Intern the entity type shared by every unit this pattern emits."""
+        if isinstance(self.entity_type, str):
+            self.entity_type = sys.intern(self.entity_type)
+
+    @cached_property
+    def compiled(self) -> re.Pattern[str]:
+        """Compiled ``pattern`` with ``flags``, built once per pattern object.
+
+        The pattern tables hold several hundred expressions, more than the
+        ``re`` module's internal cache keeps, so scanning through raw strings
+        would recompile them on every call.
+        """
+        return re.compile(self.pattern, self.flags)
+
+    @cached_property
+    def context_terms(self) -> Tuple[str, ...]:
+        """Lower-cased, de-duplicated ``context_words`` in declaration order.
+
+        Normalising once per pattern keeps keyword lower-casing out of the
+        per-match context check.
+        """
+        return tuple(dict.fromkeys(word.lower() for word in self.context_words))
+
 
 # ============================================================================
 # Validation Functions (inspired by Presidio's checksum approach)
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
+def _clinical_ids() -> Any:
+    """Import the shared identifier validators on first use.
+
+    The import stays lazy so loading this module does not pull in the
+    anonymizer package, but validators run once per regex match, so the
+    resolved module is cached instead of re-running the import each call.
+    """
+    from .anonymizer.providers import clinical_ids
+
+    return clinical_ids
+
+
 def validate_ssn(ssn_text: str) -> bool:
     """Validate SSN format and basic rules.
 
@@ -89,9 +130,7 @@ def validate_ssn(ssn_text: str) -> bool:
     Returns:
         True if valid SSN format
     """
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_ssn(ssn_text)
+    return _clinical_ids().validate_ssn(ssn_text)
 
 
 def validate_luhn(number_text: str) -> bool:
@@ -106,9 +145,7 @@ def validate_luhn(number_text: str) -> bool:
     Returns:
         True if passes Luhn checksum
     """
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_luhn(number_text)
+    return _clinical_ids().validate_luhn(number_text)
 
 
 def validate_npi(npi_text: str) -> bool:
@@ -122,23 +159,17 @@ def validate_npi(npi_text: str) -> bool:
     Returns:
         True if valid NPI
     """
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_npi(npi_text)
+    return _clinical_ids().validate_npi(npi_text)
 
 
 def validate_iban(iban_text: str) -> bool:
     """Validate an IBAN using the shared clinical identifier validator."""
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_iban(iban_text)
+    return _clinical_ids().validate_iban(iban_text)
 
 
 def validate_bic(bic_text: str) -> bool:
     """Validate a SWIFT/BIC using the shared clinical identifier validator."""
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_bic(bic_text)
+    return _clinical_ids().validate_bic(bic_text)
 
 
 def validate_phone_us(phone_text: str) -> bool:
@@ -156,9 +187,7 @@ def validate_phone_us(phone_text: str) -> bool:
     Returns:
         True if valid US phone format
     """
-    from .anonymizer.providers import clinical_ids
-
-    return clinical_ids.validate_phone_us(phone_text)
+    return _clinical_ids().validate_phone_us(phone_text)
 
 
 # Comprehensive PII regex patterns with context-aware scoring
@@ -577,28 +606,55 @@ def find_context_words(
     if not context_words:
         return False
 
-    # Extract context window
+    return _has_context_terms(
+        _context_window_text(text, start, end, context_window),
+        [word.lower() for word in context_words],
+        require_boundaries=require_boundaries,
+    )
+
+
+def _context_window_text(
+    text: str, start: int, end: int, context_window: int = 100
+) -> str:
+    """Return the lower-cased text within ``context_window`` of a match."""
     window_start = max(0, start - context_window)
     window_end = min(len(text), end + context_window)
-    context_text = text[window_start:window_end].lower()
+    return text[window_start:window_end].lower()
+
 
+def _has_context_terms(
+    context_text: str,
+    context_terms: Sequence[str],
+    *,
+    require_boundaries: bool = False,
+) -> bool:
+    """Check lower-cased ``context_terms`` against a lower-cased window."""
     # Simple lemmatization: strip common suffixes and check
     # More sophisticated would use spaCy/nltk lemmatizer
-    for word in context_words:
-        word_lower = word.lower()
+    for word_lower in context_terms:
+        # A word-boundary match is also a substring match, so the C-level
+        # containment test settles absent words without touching the regex.
+        if word_lower not in context_text:
+            continue
 
         # Direct match
-        if not require_boundaries and word_lower in context_text:
+        if not require_boundaries:
             return True
 
         # Check word boundaries (avoid partial matches like "ssn" in "assign")
         # Use word boundary pattern
-        if re.search(r"\b" + re.escape(word_lower) + r"\b", context_text):
+        if _context_word_pattern(word_lower).search(context_text):
             return True
 
     return False
 
 
+@lru_cache(maxsize=1024)
+def _context_word_pattern(word: str) -> re.Pattern[str]:
+    """Compile the word-boundary matcher for one lower-cased context word."""
+    return re.compile(r"\b" + re.escape(word) + r"\b")
+
+
 def find_semantic_units(
     text: str, patterns: Optional[List[PIIPattern]] = None
 ) -> List[Tuple[int, int, str, float, PIIPattern]]:
@@ -623,47 +679,73 @@ def find_semantic_units(
         >>> units[1]  # SSN with context "SSN:"
         (22, 33, 'ssn', 0.85, <PIIPattern>)
     """
+    return _scan_semantic_units(text, _patterns_by_priority(patterns))
+
+
+def find_semantic_units_batch(
+    texts: Sequence[str], patterns: Optional[List[PIIPattern]] = None
+) -> List[List[Tuple[int, int, str, float, PIIPattern]]]:
+    """Find semantic units in several texts with one pattern set.
+
+    Equivalent to calling :func:`find_semantic_units` per text, but the
+    pattern list is resolved and priority-ordered once for the whole batch.
+    Each text is still scanned on its own, so matches and context windows
+    never cross document boundaries.
+
+    Args:
+        texts: Input texts to analyze
+        patterns: Optional custom patterns (uses PII_PATTERNS if None)
+
+    Returns:
+        One list of semantic-unit tuples per input text, in input order.
+
+    Example:
+        >>> batches = find_semantic_units_batch(["SSN: 123-45-6789", "none"])
+        >>> [len(units) for units in batches]
+        [1, 0]
+    """
+    sorted_patterns = _patterns_by_priority(patterns)
+    return [_scan_semantic_units(text, sorted_patterns) for text in texts]
+
+
+def _patterns_by_priority(
+    patterns: Optional[List[PIIPattern]],
+) -> List[PIIPattern]:
+    """Return ``patterns`` (default ``PII_PATTERNS``) highest priority first."""
     if patterns is None:
         patterns = PII_PATTERNS
+    return sorted(patterns, key=lambda p: p.priority, reverse=True)
+
 
+def _scan_semantic_units(
+    text: str, sorted_patterns: List[PIIPattern]
+) -> List[Tuple[int, int, str, float, PIIPattern]]:
     units = []
 
-    # Sort patterns by priority (highest first)
-    sorted_patterns = sorted(patterns, key=lambda p: p.priority, reverse=True)
+    # Accepted units never overlap, so ordering their (start, end) bounds also
+    # orders the ends. A match can only collide with the last accepted unit
+    # that starts before the match ends, which turns the check into a bisect.
+    accepted: List[Tuple[int, int]] = []
 
     for pii_pattern in sorted_patterns:
-        for match in re.finditer(pii_pattern.pattern, text, pii_pattern.flags):
+        for match in pii_pattern.compiled.finditer(text):
             # Check for overlap with higher-priority existing units
-            overlaps = False
-            for existing in units:
-                existing_start, existing_end = existing[0], existing[1]
-                if match.start() < existing_end and match.end() > existing_start:
-                    overlaps = True
-                    break
-
-            if overlaps:
+            match_start, match_end = match.span()
+            position = bisect_left(accepted, (match_end,))
+            if position and accepted[position - 1][1] > match_start:
                 continue
 
-            matched_text = text[match.start() : match.end()]
-
-            has_context = bool(
-                pii_pattern.context_words
-                and find_context_words(
-                    text,
-                    match.start(),
-                    match.end(),
-                    pii_pattern.context_words,
-                )
-            )
+            # Both context checks share one lower-cased window; a boundary
+            # match implies a plain one, so a miss settles required context.
+            context_terms = pii_pattern.context_terms
+            has_context = False
+            if context_terms:
+                context_text = _context_window_text(text, match_start, match_end)
+                has_context = _has_context_terms(context_text, context_terms)
             if pii_pattern.requires_context:
-                has_required_context = find_context_words(
-                    text,
-                    match.start(),
-                    match.end(),
-                    pii_pattern.context_words,
-                    require_boundaries=True,
-                )
-                if not has_required_context:
+                if not has_context or not _has_context_terms(
+                    context_text, context_terms, require_boundaries=True
+                ):
                     continue
 
             # Calculate score with context awareness
@@ -678,7 +760,7 @@ def find_semantic_units(
             # Validate if validator exists
             validated = True
             if pii_pattern.validator:
-                is_valid = pii_pattern.validator(matched_text)
+                is_valid = pii_pattern.validator(match.group())
                 if not is_valid:
                     if pii_pattern.reject_on_validation_failure:
                         continue
@@ -686,10 +768,11 @@ def find_semantic_units(
                     score = score * 0.3  # Reduce to 30% confidence
                     validated = False
 
+            insort(accepted, (match_start, match_end))
             units.append(
                 (
-                    match.start(),
-                    match.end(),
+                    match_start,
+                    match_end,
                     pii_pattern.entity_type,
                     score,
                     pii_pattern,
@@ -849,6 +932,14 @@ def merge_entities_with_semantic_units(
     merged = []
     used_entities = set()
 
+    # Entities are ordered by start, so only a prefix can start before a unit
+    # ends, and the running maximum of their ends marks where entities still
+    # reaching past a unit's start begin. Both bounds are bisects, which keeps
+    # the overlap search from rescanning every entity for every unit.
+    entity_starts = [int(entity["start"]) for entity in entities]
+    entity_ends = [int(entity["end"]) for entity in entities]
+    reach = list(accumulate(entity_ends, max))
+
     # Process each semantic unit (includes score, pattern, and validation flag)
     for unit_tuple in semantic_units:
         # Unpack with backwards-compat for 5-element tuples (pre-v0.6.4)
@@ -865,10 +956,14 @@ def merge_entities_with_semantic_units(
             unit_start, unit_end, unit_type, unit_score, unit_pattern = unit_tuple[:5]
             unit_validated = True
         # Find all entities that overlap with this semantic unit
-        overlapping = []
-        for i, entity in enumerate(entities):
-            if entity["start"] < unit_end and entity["end"] > unit_start:
-                overlapping.append((i, entity))
+        overlapping = [
+            (i, entities[i])
+            for i in range(
+                bisect_right(reach, unit_start),
+                bisect_left(entity_starts, unit_end),
+            )
+            if entity_ends[i] > unit_start
+        ]
 
         if overlapping:
             # Calculate dominant label from model predictions
@@ -1202,9 +1297,50 @@ def _bridge_india_spans(
     }
 
 
+# Exact label spellings that ``normalize_label`` folds onto one comparison key.
+_LABEL_ALIASES: Dict[str, str] = {
+    alias: canonical
+    for canonical, aliases in (
+        ("ssn", ("ssn", "social_security", "social_security_number")),
+        (
+            "national_id",
+            (
+                "national_id",
+                "nir",
+                "insee",
+                "steuer_id",
+                "steuernummer",
+                "codice_fiscale",
+                "bsn",
+                "dni",
+                "nie",
+                "aadhaar",
+                "cpf",
+                "cnpj",
+                "teudat_zehut",
+                "teudatzehut",
+                "tz",
+            ),
+        ),
+        ("postcode", ("postcode", "zipcode", "zip", "postal_code")),
+        ("medical_record", ("medical_record_number", "mrn", "medical_record")),
+        ("account", ("account_number", "account")),
+        (
+            "payment_card",
+            ("credit_debit_card", "credit_card", "debit_card", "payment_card"),
+        ),
+    )
+    for alias in aliases
+}
+
+
+@lru_cache(maxsize=512)
 def normalize_label(label: str) -> str:
     """Normalize entity label for comparison.
 
+    Results are cached: merging compares the same few model and pattern labels
+    for every fragment and semantic unit.
+
     Examples:
         >>> normalize_label('date_of_birth')
         'date'
@@ -1227,54 +1363,33 @@ def normalize_label(label: str) -> str:
     if "address" in label_lower:
         return "address"
 
-    # Normalize ID variants
-    if label_lower in ("ssn", "social_security", "social_security_number"):
-        return "ssn"
-
-    # Normalize national ID variants
-    if label_lower in (
-        "national_id",
-        "nir",
-        "insee",
-        "steuer_id",
-        "steuernummer",
-        "codice_fiscale",
-        "bsn",
-        "dni",
-        "nie",
-        "aadhaar",
-        "cpf",
-        "cnpj",
-        "teudat_zehut",
-        "teudatzehut",
-        "tz",
-    ):
-        return "national_id"
-
-    # Normalize postal code variants
-    if label_lower in ("postcode", "zipcode", "zip", "postal_code"):
-        return "postcode"
-
-    # Normalize medical record variants
-    if label_lower in ("medical_record_number", "mrn", "medical_record"):
-        return "medical_record"
-
-    # Normalize account variants
-    if label_lower in ("account_number", "account"):
-        return "account"
-
-    # Normalize payment card variants
-    if label_lower in (
-        "credit_debit_card",
-        "credit_card",
-        "debit_card",
-        "payment_card",
-    ):
-        return "payment_card"
+    # Normalize ID, national ID, postal code, record, account and card variants
+    return _LABEL_ALIASES.get(label_lower, label_lower)
+
 
-    return label_lower
+# Specific label hierarchies, keyed by the normalized general label.
+_SPECIFICITY_HIERARCHY: Dict[str, frozenset[str]] = {
+    "date": frozenset({"date_of_birth", "date_time"}),
+    "name": frozenset({"first_name", "last_name", "full_name"}),
+    "phone": frozenset({"phone_number", "fax_number", "mobile_number"}),
+    "address": frozenset({"street_address", "home_address", "billing_address"}),
+    "id": frozenset({"ssn", "medical_record_number", "account_number", "employee_id"}),
+    "national_id": frozenset(
+        {
+            "nir",
+            "insee",
+            "steuer_id",
+            "steuernummer",
+            "codice_fiscale",
+            "cpf",
+            "cnpj",
+            "teudat_zehut",
+        }
+    ),
+}
 
 
+@lru_cache(maxsize=1024)
 def is_more_specific(label1: str, label2: str) -> bool:
     """Check if label1 is more specific than label2.
 
@@ -1293,29 +1408,5 @@ def is_more_specific(label1: str, label2: str) -> bool:
     if label2_lower in label1_lower and label1_lower != label2_lower:
         return True
 
-    # Specific label hierarchies
-    specificity_hierarchy = {
-        "date": ["date_of_birth", "date_time"],
-        "name": ["first_name", "last_name", "full_name"],
-        "phone": ["phone_number", "fax_number", "mobile_number"],
-        "address": ["street_address", "home_address", "billing_address"],
-        "id": ["ssn", "medical_record_number", "account_number", "employee_id"],
-        "national_id": [
-            "nir",
-            "insee",
-            "steuer_id",
-            "steuernummer",
-            "codice_fiscale",
-            "cpf",
-            "cnpj",
-            "teudat_zehut",
-        ],
-    }
-
-    for general, specific_list in specificity_hierarchy.items():
-        if normalize_label(label2) == general and label1_lower in [
-            s.lower() for s in specific_list
-        ]:
-            return True
-
-    return False
+    specific_labels = _SPECIFICITY_HIERARCHY.get(normalize_label(label2))
+    return specific_labels is not None and label1_lower in specific_labels
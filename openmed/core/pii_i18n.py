@@ -26,6 +26,7 @@ from importlib import resources
 from typing import Any, Dict, List, Optional, Set
 
 from .anonymizer.providers.clinical_ids import (
+    _luhn_valid,
     gstin_check_char,
     pan_check_letter,
     validate_abha,
@@ -1038,11 +1039,8 @@ def validate_german_steuer_id(text: str) -> bool:
     # Check digit frequency: in the first 10 digits, exactly one digit
     # must appear 2 or 3 times, rest appear once or zero times
     first_ten = digits[:10]
-    from collections import Counter
-
-    counts = Counter(first_ten)
-    multi_count = sum(1 for c in counts.values() if c >= 2)
-    if multi_count != 1:
+    repeated = {digit for digit in first_ten if first_ten.count(digit) > 1}
+    if len(repeated) != 1:
         return False
 
     return True
@@ -2430,15 +2428,7 @@ def validate_greek_amka(text: str) -> bool:
 
 def _passes_luhn(digits: str) -> bool:
     """Return whether an all-digit string satisfies the Luhn checksum."""
-    total = 0
-    for index, char in enumerate(reversed(digits)):
-        value = int(char)
-        if index % 2 == 1:
-            value *= 2
-            if value > 9:
-                value -= 9
-        total += value
-    return total % 10 == 0
+    return _luhn_valid(digits)
 
 
 _FINNISH_HETU_CHECK_ALPHABET = "0123456789ABCDEFHJKLMNPRSTUVWXY"
@@ -11446,21 +11436,21 @@ def get_patterns_for_language(
         + INDIA_HEALTH_ID_PII_PATTERNS
     )
 
+    # Identity de-duplication against an id set keeps each overlay linear
+    # instead of rescanning ``combined`` for every candidate pattern.
     combined = base
+    seen_ids = {id(pattern) for pattern in combined}
+    overlays = []
     if base_lang != "en":
-        language_patterns = LANGUAGE_PII_PATTERNS.get(base_lang, [])
-        combined = combined + [
-            pattern
-            for pattern in language_patterns
-            if not any(pattern is existing for existing in combined)
-        ]
-
-    for locale_key in _locale_pattern_keys(lang, locale):
-        combined = combined + [
-            pattern
-            for pattern in LOCALE_PII_PATTERNS.get(locale_key, [])
-            if not any(pattern is existing for existing in combined)
-        ]
+        overlays.append(LANGUAGE_PII_PATTERNS.get(base_lang, []))
+    overlays.extend(
+        LOCALE_PII_PATTERNS.get(locale_key, [])
+        for locale_key in _locale_pattern_keys(lang, locale)
+    )
+    for overlay in overlays:
+        added = [pattern for pattern in overlay if id(pattern) not in seen_ids]
+        combined.extend(added)
+        seen_ids.update(id(pattern) for pattern in added)
 
     if not include_indian_multi_id:
         indian_pattern_ids = {id(pattern) for pattern in INDIAN_MULTI_ID_PII_PATTERNS}
@@ -2557,9 +2557,8 @@ def _prediction_result_from_spans(
     *,
     model_name: str,
 ) -> Any:
-    from datetime import datetime
-
     from ..processing.outputs import EntityPrediction, PredictionResult
+    from .pii import _now_iso
 
     return PredictionResult(
         text=text,
@@ -2579,7 +2578,7 @@ def _prediction_result_from_spans(
             for span in spans
         ],
         model_name=model_name,
-        timestamp=datetime.now().isoformat(),
+        timestamp=_now_iso(),
     )
 
 
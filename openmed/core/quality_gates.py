@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 import warnings
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, List, Mapping, Sequence, Tuple, TypeVar
 
@@ -173,15 +174,6 @@ def _entity_risk_rank(entity: Any) -> int:
     return max(metadata_rank, label_rank)
 
 
-def _spans_overlap(
-    a_start: int,
-    a_end: int,
-    b_start: int,
-    b_end: int,
-) -> bool:
-    return a_start < b_end and a_end > b_start
-
-
 def _valid_offsets(start: Any, end: Any) -> bool:
     return isinstance(start, int) and isinstance(end, int) and start < end
 
@@ -396,16 +388,19 @@ def resolve_overlapping_entities(
     )
 
     selected: list[tuple[int, EntityT, int, int]] = []
-    selected_bounds: list[tuple[int, int]] = []
+    # Kept spans never overlap, so ordering them by start also orders them by
+    # end. A candidate can only collide with the last kept span that starts
+    # before the candidate ends, which turns the overlap test into a bisect.
+    kept_starts: list[int] = []
+    kept_ends: list[int] = []
 
     for index, entity, start, end in ranked:
-        if any(
-            _spans_overlap(start, end, kept_start, kept_end)
-            for kept_start, kept_end in selected_bounds
-        ):
+        position = bisect_left(kept_starts, end)
+        if position and kept_ends[position - 1] > start:
             continue
         selected.append((index, entity, start, end))
-        selected_bounds.append((start, end))
+        kept_starts.insert(position, start)
+        kept_ends.insert(position, end)
 
     resolved: list[tuple[int, EntityT, int | None, int | None]] = [
         (index, entity, start, end) for index, entity, start, end in selected
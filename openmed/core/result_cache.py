@@ -12,6 +12,9 @@ from threading import RLock
 
 RESULT_CACHE = None
 _CACHE_LOCK = RLock()
+# Bumped whenever loaded model weights are released so that results computed
+# by a previous load can never be served for a reloaded model.
+_MODEL_GENERATION = 0
 
 
 class ResultCache:
@@ -57,6 +60,15 @@ def get_result_cache(max_entries=128):
     return RESULT_CACHE
 
 
+def bump_model_generation():
+    """Invalidate cached results computed by previously loaded models."""
+    global _MODEL_GENERATION
+
+    with _CACHE_LOCK:
+        _MODEL_GENERATION += 1
+    return _MODEL_GENERATION
+
+
 def freeze_value(value):
     if isinstance(value, dict):
         return (
@@ -81,9 +93,13 @@ def freeze_value(value):
 
 def make_cache_key(inquiry_type, params):
     normalized = dict(params)
-    normalized["text"] = normalized.get(
-        "validated_text", normalized.get("text", "")
-    ).strip()
+    # Digest the text up front so long notes are not re-serialized into the
+    # JSON payload below; the 16-byte digest keeps the key size bounded.
+    text = normalized.get("validated_text", normalized.get("text", "")).strip()
+    normalized["text"] = hashlib.blake2b(
+        text.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    normalized["model_generation"] = _MODEL_GENERATION
     normalized["model_name"] = normalized.get(
         "validated_model",
         normalized.get("model_name", normalized.get("model_id", "")),
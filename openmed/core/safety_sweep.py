@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import re
 from dataclasses import dataclass
 from typing import Any, Mapping, Sequence
 
@@ -83,7 +82,7 @@ def _has_context(
             text,
             start,
             end,
-            pattern.context_words,
+            pattern.context_terms,
             require_boundaries=require_boundaries,
         )
     )
@@ -116,7 +115,7 @@ def _candidate_metadata(candidate: _Candidate) -> dict[str, Any]:
 def _collect_candidates(text: str, patterns: Sequence[PIIPattern]) -> list[_Candidate]:
     candidates: list[_Candidate] = []
     for pattern in patterns:
-        for match in re.finditer(pattern.pattern, text, pattern.flags):
+        for match in pattern.compiled.finditer(text):
             start, end = match.span()
             if start >= end:
                 continue
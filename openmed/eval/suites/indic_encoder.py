@@ -173,7 +173,7 @@ def _regex_spans(fixture: SyntheticIndicFixture) -> list[EvalSpan]:
         label = _PATTERN_LABELS.get(pattern.entity_type)
         if label is None:
             continue
-        for match in re.finditer(pattern.pattern, fixture.text, pattern.flags):
+        for match in pattern.compiled.finditer(fixture.text):
             value = match.group(0)
             if pattern.validator is not None and not pattern.validator(value):
                 continue
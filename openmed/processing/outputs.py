@@ -4,9 +4,10 @@ import html as html_mod
 import json
 import logging
 import unicodedata
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -95,10 +96,16 @@ class PredictionResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        result = asdict(self)
-        result["entities"] = [entity.to_dict() for entity in self.entities]
-        result["processing_time"] = _to_float(result.get("processing_time"))
-        return result
+        # Built by hand: ``dataclasses.asdict`` would deep-copy every entity
+        # only for the copies to be replaced by ``entity.to_dict()`` below.
+        return {
+            "text": self.text,
+            "entities": [entity.to_dict() for entity in self.entities],
+            "model_name": self.model_name,
+            "timestamp": self.timestamp,
+            "processing_time": _to_float(self.processing_time),
+            "metadata": deepcopy(self.metadata),
+        }
 
 
 class OutputFormatter:
@@ -449,19 +456,24 @@ class OutputFormatter:
         Returns:
             HTML string.
         """
-        html = '<div class="openmed-result">\n'
-        html += "<h3>Analysis Results</h3>\n"
-        html += f"<p><strong>Model:</strong> {html_mod.escape(str(result.model_name))}</p>\n"
-        html += f"<p><strong>Timestamp:</strong> {html_mod.escape(str(result.timestamp))}</p>\n"
+        parts = [
+            '<div class="openmed-result">\n',
+            "<h3>Analysis Results</h3>\n",
+            f"<p><strong>Model:</strong> {html_mod.escape(str(result.model_name))}</p>\n",
+            f"<p><strong>Timestamp:</strong> {html_mod.escape(str(result.timestamp))}</p>\n",
+        ]
 
         if result.processing_time:
-            html += f"<p><strong>Processing Time:</strong> {result.processing_time:.3f}s</p>\n"
+            parts.append(
+                f"<p><strong>Processing Time:</strong> {result.processing_time:.3f}s</p>\n"
+            )
 
-        html += '<div class="text-content">\n'
+        parts.append('<div class="text-content">\n<p>')
 
-        # Highlight entities in text
-        highlighted_text = html_mod.escape(result.text)
-        offset = 0
+        # Highlight entities in text. Offsets index the raw text, so each
+        # segment is escaped separately; overlapping entities are not nested.
+        text = result.text
+        cursor = 0
 
         # Sort entities by start position
         sorted_entities = sorted(
@@ -470,32 +482,27 @@ class OutputFormatter:
         )
 
         for entity in sorted_entities:
-            start = entity.start + offset
-            end = entity.end + offset
+            if entity.start < cursor:
+                continue
 
             color = self._get_entity_color(entity.label)
 
-            highlight_start = f'<span class="entity entity-{html_mod.escape(entity.label.lower())}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px;" title="Label: {html_mod.escape(entity.label)}, Confidence: {entity.confidence:.3f}">'
-            highlight_end = "</span>"
-
-            highlighted_text = (
-                highlighted_text[:start]
-                + highlight_start
-                + highlighted_text[start:end]
-                + highlight_end
-                + highlighted_text[end:]
+            parts.append(html_mod.escape(text[cursor : entity.start]))
+            parts.append(
+                f'<span class="entity entity-{html_mod.escape(entity.label.lower())}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px;" title="Label: {html_mod.escape(entity.label)}, Confidence: {entity.confidence:.3f}">'
             )
+            parts.append(html_mod.escape(text[entity.start : entity.end]))
+            parts.append("</span>")
+            cursor = max(cursor, entity.end)
 
-            offset += len(highlight_start) + len(highlight_end)
-
-        html += f"<p>{highlighted_text}</p>\n"
-        html += "</div>\n"
+        parts.append(html_mod.escape(text[cursor:]))
+        parts.append("</p>\n</div>\n")
 
         # Entity summary
         if result.entities:
-            html += '<div class="entity-summary">\n'
-            html += f"<h4>Detected Entities ({len(result.entities)})</h4>\n"
-            html += "<ul>\n"
+            parts.append('<div class="entity-summary">\n')
+            parts.append(f"<h4>Detected Entities ({len(result.entities)})</h4>\n")
+            parts.append("<ul>\n")
 
             for entity in result.entities:
                 confidence_str = (
@@ -503,13 +510,15 @@ class OutputFormatter:
                     if self.include_confidence
                     else ""
                 )
-                html += f"<li><strong>{html_mod.escape(entity.label)}:</strong> {html_mod.escape(entity.text)}{confidence_str}</li>\n"
+                parts.append(
+                    f"<li><strong>{html_mod.escape(entity.label)}:</strong> {html_mod.escape(entity.text)}{confidence_str}</li>\n"
+                )
 
-            html += "</ul>\n"
-            html += "</div>\n"
+            parts.append("</ul>\n")
+            parts.append("</div>\n")
 
-        html += "</div>\n"
-        return html
+        parts.append("</div>\n")
+        return "".join(parts)
 
     def _get_entity_color(self, label: str) -> str:
         """Get color for entity label.
@@ -543,7 +552,24 @@ class OutputFormatter:
         Returns:
             List of dictionaries for CSV writing.
         """
-        rows = []
+        return list(self.iter_csv_rows(result))
+
+    def iter_csv_rows(self, result: PredictionResult) -> Iterator[Dict[str, Any]]:
+        """Yield CSV-compatible rows one entity at a time.
+
+        Rows match :meth:`to_csv_rows`, so large results can be streamed into
+        ``csv.DictWriter`` without materializing every row first.
+
+        Args:
+            result: Prediction result to convert.
+
+        Yields:
+            One dictionary per entity.
+        """
+        model_name = result.model_name
+        timestamp = result.timestamp
+        processing_time = result.processing_time
+        original_text = result.text
         for entity in result.entities:
             row = {
                 "text": entity.text,
@@ -551,10 +577,10 @@ class OutputFormatter:
                 "confidence": entity.confidence,
                 "start": entity.start,
                 "end": entity.end,
-                "model_name": result.model_name,
-                "timestamp": result.timestamp,
-                "processing_time": result.processing_time,
-                "original_text": result.text,
+                "model_name": model_name,
+                "timestamp": timestamp,
+                "processing_time": processing_time,
+                "original_text": original_text,
             }
             if entity.metadata:
                 sentence_index = entity.metadata.get("sentence_index")
@@ -567,8 +593,18 @@ class OutputFormatter:
                     if key in {"sentence_index", "sentence_text"}:
                         continue
                     row[f"metadata_{key}"] = value
-            rows.append(row)
-        return rows
+            yield row
+
+
+# OutputFormatter method rendering each format_predictions() output_format.
+# Names are resolved on the formatter instance so subclass overrides apply;
+# None returns the PredictionResult itself.
+_OUTPUT_FORMATS: Dict[str, Optional[str]] = {
+    "dict": None,
+    "json": "to_json",
+    "html": "to_html",
+    "csv": "to_csv_rows",
+}
 
 
 def format_predictions(
@@ -590,6 +626,11 @@ def format_predictions(
     Returns:
         Formatted output in requested format.
     """
+    try:
+        method_name = _OUTPUT_FORMATS[output_format]
+    except KeyError:
+        raise ValueError(f"Unsupported output format: {output_format}") from None
+
     formatter_keys = {"include_confidence", "confidence_threshold", "group_entities"}
     formatter_kwargs = {k: v for k, v in kwargs.items() if k in formatter_keys}
     downstream_kwargs = {k: v for k, v in kwargs.items() if k not in formatter_keys}
@@ -602,13 +643,6 @@ def format_predictions(
         **downstream_kwargs,
     )
 
-    if output_format == "dict":
+    if method_name is None:
         return result
-    elif output_format == "json":
-        return formatter.to_json(result)
-    elif output_format == "html":
-        return formatter.to_html(result)
-    elif output_format == "csv":
-        return formatter.to_csv_rows(result)
-    else:
-        raise ValueError(f"Unsupported output format: {output_format}")
+    return getattr(formatter, method_name)(result)
@@ -7,6 +7,7 @@ import re
 import unicodedata
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
@@ -978,6 +979,59 @@ def _normalize_legacy_unit_groups(
     return normalized
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# Preserve medical measurements (e.g., "120/80", "98.6°F")
+_STANDALONE_NUMBER_RE = re.compile(r"\b\d+(?:[./]\d+)*\b(?![°%])")
+# Keep hyphens in compound medical terms
+_PUNCTUATION_RE = re.compile(r"[^\w\s\-]")
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]+\s+")
+
+_DOSAGE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b\d+\s*(?:mg|ml|g|kg|mcg|units?)\b",
+        r"\b\d+\.\d+\s*(?:mg|ml|g|kg|mcg|units?)\b",
+    )
+)
+_VITAL_SIGN_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b(?:bp|blood pressure):?\s*\d+/\d+\b",
+        r"\b(?:hr|heart rate):?\s*\d+\b",
+        r"\b(?:temp|temperature):?\s*\d+\.?\d*\s*[°]?[fF]?\b",
+        r"\b(?:rr|respiratory rate):?\s*\d+\b",
+    )
+)
+
+
+def _abbreviation_alternation(abbreviations: frozenset[str]) -> str:
+    # Longest first so an abbreviation never loses to one of its prefixes.
+    ordered = sorted(abbreviations, key=lambda abbrev: (-len(abbrev), abbrev))
+    return "|".join(re.escape(abbrev) for abbrev in ordered)
+
+
+@lru_cache(maxsize=32)
+def _abbreviation_matcher(
+    abbreviations: frozenset[str],
+) -> tuple[re.Pattern[str], Dict[str, str]]:
+    """Return one whole-word matcher for ``abbreviations`` and its spellings.
+
+    The mapping takes a lower-cased match back to the configured spelling.
+    """
+    pattern = re.compile(
+        rf"\b(?:{_abbreviation_alternation(abbreviations)})\b", re.IGNORECASE
+    )
+    return pattern, {abbrev.lower(): abbrev for abbrev in abbreviations}
+
+
+@lru_cache(maxsize=32)
+def _abbreviation_dot_pattern(abbreviations: frozenset[str]) -> re.Pattern[str]:
+    """Return the matcher for abbreviations followed by a full stop."""
+    return re.compile(
+        rf"\b(?:{_abbreviation_alternation(abbreviations)})\.", re.IGNORECASE
+    )
+
+
 class TextProcessor:
     """Handles text preprocessing and cleaning for medical text analysis."""
 
@@ -1058,39 +1112,34 @@ class TextProcessor:
 
         # Normalize whitespace
         if self.normalize_whitespace:
-            text = re.sub(r"\s+", " ", text.strip())
-
-        # Handle medical abbreviations before other processing
-        protected_abbrevs = {}
-        if not self.remove_punctuation:
-            for i, abbrev in enumerate(self.medical_abbreviations):
-                placeholder = f"__ABBREV_{i}__"
-                text = re.sub(
-                    rf"\b{re.escape(abbrev)}\b", placeholder, text, flags=re.IGNORECASE
-                )
-                protected_abbrevs[placeholder] = abbrev
+            text = _WHITESPACE_RE.sub(" ", text.strip())
+
+        # Rewrite medical abbreviations to their configured spelling in a
+        # single pass; later steps cannot alter a whole-word abbreviation.
+        if not self.remove_punctuation and self.medical_abbreviations:
+            pattern, spellings = _abbreviation_matcher(
+                frozenset(self.medical_abbreviations)
+            )
+            text = pattern.sub(
+                lambda match: spellings.get(match.group().lower(), match.group()),
+                text,
+            )
 
         # Remove or clean numbers
         if self.remove_numbers:
-            # Preserve medical measurements (e.g., "120/80", "98.6°F")
-            text = re.sub(r"\b\d+(?:[./]\d+)*\b(?![°%])", " ", text)
+            text = _STANDALONE_NUMBER_RE.sub(" ", text)
 
         # Remove punctuation
         if self.remove_punctuation:
-            # Keep hyphens in compound medical terms
-            text = re.sub(r"[^\w\s\-]", " ", text)
+            text = _PUNCTUATION_RE.sub(" ", text)
 
         # Convert to lowercase
         if self.lowercase:
             text = text.lower()
 
-        # Restore protected abbreviations
-        for placeholder, abbrev in protected_abbrevs.items():
-            text = text.replace(placeholder, abbrev)
-
         # Final whitespace normalization
         if self.normalize_whitespace:
-            text = re.sub(r"\s+", " ", text.strip())
+            text = _WHITESPACE_RE.sub(" ", text.strip())
 
         logger.debug(
             "Text cleaning completed: input_chars=%d output_chars=%d changed=%s",
@@ -1131,18 +1180,19 @@ class TextProcessor:
             List of sentences.
         """
         # Medical abbreviations that shouldn't trigger sentence breaks
-        abbrev_pattern = r"\b(?:" + "|".join(self.medical_abbreviations) + r")\."
+        text_modified = text
+        if self.medical_abbreviations:
+            abbrev_pattern = _abbreviation_dot_pattern(
+                frozenset(self.medical_abbreviations)
+            )
 
-        # Temporarily replace medical abbreviations
-        text_modified = re.sub(
-            abbrev_pattern,
-            lambda m: m.group().replace(".", "___DOT___"),
-            text,
-            flags=re.IGNORECASE,
-        )
+            # Temporarily replace medical abbreviations
+            text_modified = abbrev_pattern.sub(
+                lambda m: m.group().replace(".", "___DOT___"), text
+            )
 
         # Simple sentence segmentation
-        sentences = re.split(r"[.!?]+\s+", text_modified)
+        sentences = _SENTENCE_BREAK_RE.split(text_modified)
 
         # Restore dots in abbreviations
         sentences = [s.replace("___DOT___", ".") for s in sentences if s.strip()]
@@ -1167,26 +1217,12 @@ class TextProcessor:
         }
 
         # Dosage patterns
-        dosage_patterns = [
-            r"\b\d+\s*(?:mg|ml|g|kg|mcg|units?)\b",
-            r"\b\d+\.\d+\s*(?:mg|ml|g|kg|mcg|units?)\b",
-        ]
-
-        for pattern in dosage_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["dosages"].extend(matches)
+        for pattern in _DOSAGE_PATTERNS:
+            entities["dosages"].extend(pattern.findall(text))
 
         # Vital signs patterns
-        vital_patterns = [
-            r"\b(?:bp|blood pressure):?\s*\d+/\d+\b",
-            r"\b(?:hr|heart rate):?\s*\d+\b",
-            r"\b(?:temp|temperature):?\s*\d+\.?\d*\s*[°]?[fF]?\b",
-            r"\b(?:rr|respiratory rate):?\s*\d+\b",
-        ]
-
-        for pattern in vital_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["vital_signs"].extend(matches)
+        for pattern in _VITAL_SIGN_PATTERNS:
+            entities["vital_signs"].extend(pattern.findall(text))
 
         # Clean up duplicates
         for key in entities:
@@ -165,6 +165,36 @@ def test_extract_pii_cache_with_five_calls(monkeypatch) -> None:
     assert calls["count"] == 3
 
 
+def test_extract_pii_cache_invalidated_by_model_unload(monkeypatch) -> None:
+    reset_cache()
+    calls = {"count": 0}
+
+    def fake_batch(texts, **kwargs):
+        calls["count"] += 1
+        return [
+            PredictionResult(
+                texts[0], [], kwargs["model_name"], datetime.now().isoformat()
+            )
+        ]
+
+    monkeypatch.setattr(pii, "_extract_pii_batch", fake_batch)
+    kwargs = dict(model_name="pii", confidence_threshold=0.5, cache_results=True)
+
+    monkeypatch.setattr("openmed.core.models.HF_AVAILABLE", True)
+    loader = ModelLoader()
+    monkeypatch.setattr(loader, "_release_cached_memory", lambda: None)
+    loader._models["OpenMed/pii"] = object()
+    first = pii.extract_pii("Patient John", **kwargs)
+    assert pii.extract_pii("Patient John", **kwargs) is first
+
+    loader.unload_all_models()
+    reloaded = pii.extract_pii("Patient John", **kwargs)
+
+    assert reloaded is not first
+    assert pii.extract_pii("Patient John", **kwargs) is reloaded
+    assert calls["count"] == 2
+
+
 def test_deidentify_cache_with_five_calls(monkeypatch) -> None:
     reset_cache()
     calls = {"count": 0}
@@ -782,6 +782,38 @@ class TestAnalyzeTextBehaviour:
         assert loader._pipelines == {}
         release_memory.assert_called_once()
 
+    def test_shared_loader_is_reused_per_config_and_evicts_oldest(self, monkeypatch):
+        """Process-wide loaders are keyed by config values and bounded in number."""
+        from openmed.core import models
+
+        monkeypatch.setattr(models, "_SHARED_LOADER_LIMIT", 2)
+        models.clear_shared_loaders()
+        loader_cls = Mock(side_effect=lambda config: Mock(config=config))
+        first_config, second_config, third_config = (
+            OpenMedConfig(timeout=1),
+            OpenMedConfig(timeout=2),
+            OpenMedConfig(timeout=3),
+        )
+
+        try:
+            first = models._shared_model_loader(first_config, loader_cls)
+            assert models._shared_model_loader(first_config, loader_cls) is first
+            equal_config = OpenMedConfig(timeout=1)
+            assert models._shared_model_loader(equal_config, loader_cls) is first
+            second = models._shared_model_loader(second_config, loader_cls)
+            assert second is not first
+
+            models._shared_model_loader(third_config, loader_cls)
+
+            # Eviction forgets the loader without unloading models that another
+            # thread may still be using.
+            first.unload_all_models.assert_not_called()
+            assert models._shared_model_loader(second_config, loader_cls) is second
+            assert models._shared_model_loader(first_config, loader_cls) is not first
+            assert loader_cls.call_count == 4
+        finally:
+            models.clear_shared_loaders()
+
     @patch("openmed.core.models.HF_AVAILABLE", True)
     def test_loaded_models_reports_cache_counts_by_model(self):
         """Loaded model reporting should aggregate cache state by model id."""
@@ -3,22 +3,35 @@
 from __future__ import annotations
 
 import builtins
+import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from openmed.core import models
+from openmed.core.config import OpenMedConfig, get_config, set_config
 from openmed.core.pii import (
     DeidentificationResult,
     PIIEntity,
+    _build_reidentification_mapping,
+    _fake_data_pool,
     _format_date_like_original,
     _generate_fake_pii,
+    _now,
+    _now_iso,
     _random_nonzero_shift,
     _redact_entity,
     _shift_date,
+    _shift_date_basic,
+    _shift_numeric_date,
     _strip_accents,
     deidentify,
     extract_pii,
+    extract_pii_batch,
     reidentify,
 )
 from openmed.processing.outputs import EntityPrediction, PredictionResult
@@ -28,6 +41,42 @@ from openmed.processing.outputs import EntityPrediction, PredictionResult
 # ---------------------------------------------------------------------------
 
 
+class _PicklingExecutor(ThreadPoolExecutor):
+    """Thread pool that pickles payloads and results like a process pool."""
+
+    def __init__(self, max_workers=None, mp_context=None):
+        super().__init__(max_workers=max_workers)
+
+    def map(self, fn, *iterables, **kwargs):
+        payloads = pickle.loads(pickle.dumps(list(zip(*iterables))))
+        return super().map(
+            lambda args: pickle.loads(pickle.dumps(fn(*args))), payloads, **kwargs
+        )
+
+
+def _stub_backend_chunk(texts, batch_kwargs):
+    """Run the real worker entry point in a spawned process with a stub backend."""
+    import openmed.core.pii as pii_module
+
+    def fake_batch(chunk_texts, **kwargs):
+        return [
+            PredictionResult(
+                text=text,
+                entities=[],
+                model_name="stub",
+                timestamp="",
+                metadata={"timeout": kwargs["config"].timeout, "pid": os.getpid()},
+            )
+            for text in chunk_texts
+        ]
+
+    with (
+        patch("openmed.core.models.HF_AVAILABLE", False),
+        patch.object(pii_module, "_extract_pii_batch", side_effect=fake_batch),
+    ):
+        return pii_module._extract_pii_chunk(texts, batch_kwargs)
+
+
 @pytest.fixture
 def mock_pii_entities():
     """Mock PII entities for testing."""
@@ -91,6 +140,23 @@ class TestPIIEntity:
         )
         assert entity.entity_type == "EMAIL"
 
+    def test_label_and_entity_type_are_interned(self):
+        """Dynamically built labels share the interned string object."""
+        label = "".join(["PH", "ONE"])
+        entity_type = "".join(["PHONE", "_NUMBER"])
+        first = PIIEntity(text="555", label=label, start=0, end=3, confidence=0.9)
+        second = PIIEntity(
+            text="556",
+            label="PHONE",
+            start=0,
+            end=3,
+            confidence=0.9,
+            entity_type=entity_type,
+        )
+        assert first.label is second.label
+        assert first.entity_type is first.label
+        assert second.entity_type is sys.intern("PHONE_NUMBER")
+
     def test_pii_specific_attributes(self):
         """Test PII-specific attributes."""
         entity = PIIEntity(
@@ -116,6 +182,14 @@ class TestPIIEntity:
 class TestDeidentificationResult:
     """Tests for DeidentificationResult dataclass."""
 
+    def test_uses_slots(self):
+        """Results carry no per-instance __dict__."""
+        result = DeidentificationResult("a", "a", [], "mask", datetime.now())
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+
     def test_basic_creation(self):
         """Test creating DeidentificationResult."""
         entities = [
@@ -344,6 +418,94 @@ class TestExtractPII:
         mock_merge.assert_not_called()
         mock_be.assert_called_once_with(str(artifact_dir))
 
+    @patch("openmed.core.pii._extract_pii_batch")
+    def test_extract_pii_batch_submits_longest_first_and_keeps_order(self, mock_batch):
+        """Batch extraction sorts by length for padding but preserves order."""
+        mock_batch.side_effect = lambda texts, **kwargs: [
+            PredictionResult(text=text, entities=[], model_name="m", timestamp="")
+            for text in texts
+        ]
+
+        results = extract_pii_batch(["a", "ccc", "bb"], lang="fr")
+
+        assert mock_batch.call_args[0][0] == ["ccc", "bb", "a"]
+        assert mock_batch.call_args[1]["lang"] == "fr"
+        assert [result.text for result in results] == ["a", "ccc", "bb"]
+
+    @patch("openmed.core.models.HF_AVAILABLE", False)
+    @patch("openmed.core.pii.ProcessPoolExecutor", _PicklingExecutor)
+    @patch("openmed.core.pii._extract_pii_batch")
+    def test_extract_pii_batch_splits_large_corpora_across_processes(self, mock_batch):
+        """Large corpora are split into balanced chunks and reassembled."""
+        mock_batch.side_effect = lambda texts, **kwargs: [
+            PredictionResult(text=text, entities=[], model_name="m", timestamp="")
+            for text in texts
+        ]
+        texts = [str(index) * (3000 + index) for index in range(40)]
+
+        results = extract_pii_batch(texts, max_processes=4)
+
+        assert mock_batch.call_count == 4
+        chunk_sizes = [sum(map(len, call[0][0])) for call in mock_batch.call_args_list]
+        assert max(chunk_sizes) - min(chunk_sizes) < 3100
+        assert [result.text for result in results] == texts
+
+        mock_batch.reset_mock()
+        extract_pii_batch(texts[:10], max_processes=4)
+        assert mock_batch.call_count == 1
+
+    @patch("openmed.core.models.HF_AVAILABLE", True)
+    @patch("openmed.core.models.ModelLoader")
+    @patch("openmed.core.pii.ProcessPoolExecutor", _PicklingExecutor)
+    @patch("openmed.core.pii._extract_pii_batch")
+    def test_extract_pii_batch_sends_parent_config_to_workers(
+        self, mock_batch, mock_loader_cls
+    ):
+        """Worker payloads pickle, carry set_config(), and share one loader."""
+        mock_batch.side_effect = lambda texts, **kwargs: [
+            PredictionResult(text=text, entities=[], model_name="m", timestamp="")
+            for text in texts
+        ]
+        texts = [str(index) * (3000 + index) for index in range(40)]
+        previous_config = get_config()
+        parent_config = OpenMedConfig(timeout=1234)
+        models.clear_shared_loaders()
+        set_config(parent_config)
+        try:
+            results = extract_pii_batch(texts, max_processes=4)
+        finally:
+            set_config(previous_config)
+            models.clear_shared_loaders()
+
+        assert [result.text for result in results] == texts
+        worker_configs = [call[1]["config"] for call in mock_batch.call_args_list]
+        assert len(worker_configs) == 4
+        assert all(config is not parent_config for config in worker_configs)
+        assert all(config.timeout == 1234 for config in worker_configs)
+        assert mock_loader_cls.call_count == 1
+
+    @pytest.mark.slow
+    @patch("openmed.core.pii._extract_pii_chunk", _stub_backend_chunk)
+    def test_extract_pii_batch_runs_chunks_in_spawned_processes(self):
+        """The process-pool path spawns real workers and keeps input order."""
+        texts = [str(index % 10) * 3000 for index in range(40)]
+        previous_config = get_config()
+        set_config(OpenMedConfig(timeout=4321))
+        try:
+            results = extract_pii_batch(texts, max_processes=2)
+        finally:
+            set_config(previous_config)
+
+        assert [result.text for result in results] == texts
+        assert {result.model_name for result in results} == {"stub"}
+        assert {result.metadata["timeout"] for result in results} == {4321}
+        assert os.getpid() not in {result.metadata["pid"] for result in results}
+
+    def test_extract_pii_batch_rejects_non_positive_process_count(self):
+        """Process counts below one are rejected."""
+        with pytest.raises(ValueError, match="max_processes"):
+            extract_pii_batch(["a"], max_processes=0)
+
 
 # ---------------------------------------------------------------------------
 # deidentify Tests
@@ -458,6 +620,27 @@ class TestDeidentify:
         assert result.deidentified_text == "[NAME] at [PHONE]"
         assert len(result.pii_entities) == 2
 
+    @patch("openmed.core.pii.extract_pii")
+    def test_deidentify_splices_unordered_adjacent_entities(self, mock_extract):
+        """Test deidentify stitches adjacent spans regardless of input order."""
+        mock_extract.return_value = PredictionResult(
+            text="Call John555-1234 now",
+            entities=[
+                EntityPrediction(
+                    text="555-1234", label="PHONE", start=9, end=17, confidence=0.90
+                ),
+                EntityPrediction(
+                    text="John", label="NAME", start=5, end=9, confidence=0.95
+                ),
+            ],
+            model_name="test",
+            timestamp=datetime.now().isoformat(),
+        )
+
+        result = deidentify("Call John555-1234 now", method="remove")
+
+        assert result.deidentified_text == "Call  now"
+
     @patch("openmed.core.pii.extract_pii")
     def test_deidentify_with_keep_mapping(self, mock_extract):
         """Test deidentify stores mapping when keep_mapping=True."""
@@ -526,6 +709,22 @@ class TestDeidentify:
         assert result.deidentified_text == "No PII here"
         assert len(result.pii_entities) == 0
 
+    @patch("openmed.core.pii.extract_pii")
+    def test_deidentify_no_entities_keeps_empty_mapping(self, mock_extract):
+        """Clean text still returns an (empty) mapping when one was requested."""
+        mock_extract.return_value = PredictionResult(
+            text="No PII here",
+            entities=[],
+            model_name="test",
+            timestamp=datetime.now().isoformat(),
+        )
+
+        result = deidentify("No PII here", method="replace", keep_mapping=True)
+
+        assert result.deidentified_text == "No PII here"
+        assert result.mapping == {}
+        assert result.method == "replace"
+
     @patch("openmed.core.pii.extract_pii")
     def test_deidentify_confidence_threshold(self, mock_extract):
         """Test deidentify uses custom confidence threshold."""
@@ -848,6 +1047,12 @@ class TestRedactEntity:
         result2 = _redact_entity(entity2, "hash")
         assert result1 == result2
 
+    def test_redact_hash_tag_is_stable_across_releases(self):
+        """Hash tags keep linking to digests produced by earlier releases."""
+        entity = PIIEntity(text="John", label="NAME", start=0, end=4, confidence=0.9)
+
+        assert _redact_entity(entity, "hash") == "NAME_a8cfcd74"
+
     def test_redact_shift_dates_for_date_entity(self):
         """Test shift_dates method for DATE entities."""
         entity = PIIEntity(
@@ -920,6 +1125,27 @@ class TestGenerateFakePII:
             result = _generate_fake_pii("NAME")
             assert result in ["Jane Smith", "John Doe", "Alex Johnson", "Sam Taylor"]
 
+    def test_generate_fake_resolves_label_pool_once(self):
+        """Repeated labels reuse the resolved pool and only redraw a value."""
+        _fake_data_pool.cache_clear()
+
+        for _ in range(5):
+            _generate_fake_pii("NAME", lang="fr")
+
+        assert _fake_data_pool.cache_info().misses == 1
+        assert _fake_data_pool.cache_info().hits == 4
+
+    def test_fake_data_pool_is_frozen_with_english_fallback(self):
+        """Pools are immutable tuples and fall back to English per label."""
+        from openmed.core.pii_i18n import LANGUAGE_FAKE_DATA
+
+        pool = _fake_data_pool("NAME", "fr")
+
+        assert isinstance(pool, tuple)
+        assert pool == tuple(LANGUAGE_FAKE_DATA["fr"]["NAME"])
+        assert _fake_data_pool("NAME", "xx") == tuple(LANGUAGE_FAKE_DATA["en"]["NAME"])
+        assert _fake_data_pool("NOT_A_LABEL", "fr") == ()
+
 
 # ---------------------------------------------------------------------------
 # _shift_date Tests
@@ -970,6 +1196,32 @@ class TestShiftDate:
         assert _shift_date("03/15/22", 30, lang="en") == "04/14/2022"
         assert _shift_date("15-03-22", 30, lang="fr") == "14-04-2022"
 
+    def test_shift_date_basic_uses_language_pattern_order(self):
+        """The fallback shifter picks field order from the language convention."""
+        assert _shift_date_basic("03/04/2020", 1, lang="en") == "03/05/2020"
+        assert _shift_date_basic("03/04/2020", 1, lang="fr") == "04/04/2020"
+        assert _shift_date_basic("03.04.2020", 1, lang="de") == "04.04.2020"
+        assert _shift_date_basic("2020/03/04", 1, lang="ja") == "2020/03/05"
+        assert _shift_date_basic("13/04/2020", 1, lang="en") == "14/04/2020"
+
+    def test_shift_date_numeric_fast_path_matches_dateutil(self):
+        """Numeric dates shifted by ordinal arithmetic match the dateutil path."""
+        pytest.importorskip("dateutil")
+
+        assert _shift_numeric_date("01/15/2020", 30, False, "en") == "02/14/2020"
+        assert _shift_numeric_date("15.01.2020", 30, False, "de") == "14.02.2020"
+        assert _shift_numeric_date("2020-01-15", 30, False, "en") == "2020-02-14"
+        assert _shift_numeric_date("02/28/2019", 366, True, "en") == "02/28/2019"
+        # Readings the language would not prefer are left to dateutil.
+        assert _shift_numeric_date("13/04/2020", 1, False, "en") is None
+        assert _shift_numeric_date("2020-01-15", 30, False, "fr") is None
+        assert _shift_date("13/04/2020", 1, lang="en") == "04/14/2020"
+
+    def test_shift_date_rejects_spans_without_digits(self):
+        """Digit-free spans are masked instead of anchored to today's date."""
+        assert _shift_date("January", 30) == "[DATE_SHIFTED]"
+        assert _shift_date("Monday", 30, lang="fr") == "[DATE_SHIFTED]"
+
     def test_shift_date_invalid_format(self):
         """Test shift_date with unparseable format returns placeholder."""
         result = _shift_date("not-a-date", 30)
@@ -1135,6 +1387,35 @@ class TestRandomNonzeroShift:
             _random_nonzero_shift(low=0, high=0)
 
 
+# ---------------------------------------------------------------------------
+# Result timestamp Tests
+# ---------------------------------------------------------------------------
+
+
+class TestResultTimestamps:
+    """Tests for the per-second cached result timestamp helpers."""
+
+    def test_now_iso_reuses_string_within_same_second(self, monkeypatch):
+        """Calls inside one epoch second share the formatted timestamp."""
+        monkeypatch.setattr("openmed.core.pii.time.time", lambda: 1_700_000_000.25)
+        first = _now_iso()
+        monkeypatch.setattr("openmed.core.pii.time.time", lambda: 1_700_000_000.75)
+
+        assert _now_iso() is first
+        assert first == datetime.fromtimestamp(1_700_000_000).isoformat()
+
+    def test_now_refreshes_when_second_advances(self, monkeypatch):
+        """A new epoch second produces a new datetime and ISO string."""
+        monkeypatch.setattr("openmed.core.pii.time.time", lambda: 1_700_000_000.0)
+        before = _now()
+        monkeypatch.setattr("openmed.core.pii.time.time", lambda: 1_700_000_001.0)
+        after = _now()
+
+        assert (after - before).total_seconds() == 1
+        assert after.microsecond == 0
+        assert _now_iso() == after.isoformat()
+
+
 # ---------------------------------------------------------------------------
 # reidentify Tests
 # ---------------------------------------------------------------------------
@@ -1188,6 +1469,36 @@ class TestReidentify:
 
         assert result == "John Doe called John Doe twice"
 
+    def test_reidentify_prefers_longest_overlapping_surrogate(self):
+        """A surrogate that prefixes another must not shadow the longer one."""
+        mapping = {"Sam": "Casey", "Sam Lee": "Casey Example"}
+        deidentified = "Sam Lee met Sam"
+
+        result = reidentify(deidentified, mapping)
+
+        assert result == "Casey Example met Casey"
+
+    def test_reidentify_does_not_rescan_restored_text(self):
+        """Restored originals are not themselves treated as placeholders."""
+        mapping = {"[NAME]": "[PHONE]", "[PHONE]": "555-1234"}
+
+        result = reidentify("[NAME] at [PHONE]", mapping)
+
+        assert result == "[PHONE] at 555-1234"
+
+    def test_reidentify_occurrence_and_plain_keys_in_one_pass(self):
+        """Occurrence-aware entries restore in order alongside plain ones."""
+        mapping = _build_reidentification_mapping(
+            {
+                "Alex": [(0, "Sam"), (30, "Jo")],
+                "[PHONE]": [(10, "555-1234")],
+            }
+        )
+
+        result = reidentify("Alex at [PHONE], then Alex again", mapping)
+
+        assert result == "Sam at 555-1234, then Jo again"
+
 
 # ---------------------------------------------------------------------------
 # Multilingual PII Tests
@@ -1,5 +1,7 @@
 """Tests for PII entity merger with context-aware scoring."""
 
+import re
+
 import pytest
 
 from openmed.core.pii_entity_merger import (
@@ -7,6 +9,7 @@ from openmed.core.pii_entity_merger import (
     calculate_dominant_label,
     find_context_words,
     find_semantic_units,
+    find_semantic_units_batch,
     merge_entities_with_semantic_units,
     validate_luhn,
     validate_npi,
@@ -56,6 +59,13 @@ class TestValidators:
         assert validate_luhn("4532015112830367") == False  # Wrong checksum
         assert validate_luhn("1234567890123456") == False  # Wrong checksum
 
+    def test_validate_luhn_odd_length_and_separators(self):
+        """Odd-length numbers and separators keep the checksum alignment."""
+        assert validate_luhn("378282246310005") == True  # Amex, 15 digits
+        assert validate_luhn("3782 822463 10005") == True
+        assert validate_luhn("4532-0151-1283-0366") == True
+        assert validate_luhn("378282246310006") == False
+
     def test_validate_npi_valid(self):
         """Test valid NPI numbers."""
         # Valid NPI with correct checksum
@@ -76,6 +86,20 @@ class TestContextDetection:
         # SSN is at positions 13-24
         assert find_context_words(text, 13, 24, ["ssn", "social security"]) == True
 
+    def test_find_context_words_require_boundaries(self):
+        """Boundary mode rejects keywords embedded in longer words."""
+        embedded = "Classnote 123-45-6789"
+        standalone = "Class ssn 123-45-6789"
+        assert find_context_words(embedded, 10, 21, ["ssn"]) == True
+        assert (
+            find_context_words(embedded, 10, 21, ["ssn"], require_boundaries=True)
+            == False
+        )
+        assert (
+            find_context_words(standalone, 10, 21, ["ssn"], require_boundaries=True)
+            == True
+        )
+
     def test_find_context_words_not_found(self):
         """Test when context words are not present."""
         text = "Patient ID: 123-45-6789"
@@ -107,6 +131,66 @@ class TestContextDetection:
 class TestSemanticUnitsWithScoring:
     """Test semantic unit detection with context-aware scoring."""
 
+    def test_pattern_is_compiled_once_with_its_flags(self):
+        """The compiled regex is cached on the pattern and honours its flags."""
+        pattern = PIIPattern(r"mrn\d+", "mrn")
+
+        assert pattern.compiled is pattern.compiled
+        assert pattern.compiled.flags & re.IGNORECASE
+        units = find_semantic_units("see MRN123", [pattern])
+        assert [unit[:3] for unit in units] == [(4, 10, "mrn")]
+
+    def test_pattern_entity_type_is_interned(self):
+        """Runtime-built labels share one string object across patterns."""
+        first = PIIPattern(r"a", "".join(["national", "_id"]))
+        second = PIIPattern(r"b", "_".join(["national", "id"]))
+
+        assert first.entity_type is second.entity_type
+
+    def test_context_terms_are_lowercased_and_deduplicated(self):
+        """Mixed-case keywords still boost scores after normalisation."""
+        pattern = PIIPattern(
+            r"\d{6}",
+            "id_num",
+            base_score=0.3,
+            context_words=["Patient ID", "patient id", "MRN"],
+            requires_context=True,
+        )
+
+        assert pattern.context_terms == ("patient id", "mrn")
+        units = find_semantic_units("Patient ID: 123456 and 654321", [pattern])
+        assert [unit[:3] for unit in units] == [
+            (12, 18, "id_num"),
+            (23, 29, "id_num"),
+        ]
+        assert find_semantic_units("Case 123456", [pattern]) == []
+
+    def test_lower_priority_matches_only_fill_gaps(self):
+        """Lower-priority matches overlapping a kept unit are dropped."""
+        patterns = [
+            PIIPattern(r"\d{4}", "long", priority=10),
+            PIIPattern(r"\d{2}", "short", priority=1),
+        ]
+
+        units = find_semantic_units("12 3456 78 9012345", patterns)
+
+        assert [unit[:3] for unit in units] == [
+            (0, 2, "short"),
+            (3, 7, "long"),
+            (8, 10, "short"),
+            (11, 15, "long"),
+            (15, 17, "short"),
+        ]
+
+    def test_batch_matches_per_text_scans(self):
+        """Batch scanning returns the same units as scanning texts one by one."""
+        texts = ["SSN: 123-45-6789", "", "Call (555) 123-4567 on 01/15/1970"]
+
+        batches = find_semantic_units_batch(texts)
+
+        assert batches == [find_semantic_units(text) for text in texts]
+        assert batches[1] == []
+
     def test_ssn_with_context(self):
         """Test SSN detection with context boosts score."""
         text = "Patient SSN: 123-45-6789"
@@ -357,6 +441,15 @@ class TestMultilingualPatterns:
         assert normalize_label("cnpj") == "national_id"
         assert normalize_label("teudat_zehut") == "national_id"
 
+    def test_normalize_label_substring_rules_win_over_aliases(self):
+        """Substring families apply before exact aliases, case-insensitively."""
+        from openmed.core.pii_entity_merger import normalize_label
+
+        assert normalize_label("ACCOUNT_DATE") == "date"
+        assert normalize_label("Fax_Number") == "phone"
+        assert normalize_label("MRN") == "medical_record"
+        assert normalize_label("Custom_Label") == "custom_label"
+
     def test_normalize_label_postcode_variants(self):
         """Test normalize_label handles postcode variants."""
         from openmed.core.pii_entity_merger import normalize_label
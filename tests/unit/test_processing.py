@@ -69,6 +69,19 @@ class TestTextProcessor:
         assert "BP" in result or "bp" in result
         assert "HR" in result or "hr" in result
 
+    def test_clean_text_lowercase_keeps_medical_abbreviations(self):
+        """Lower-casing does not disturb abbreviation handling."""
+        processor = TextProcessor(lowercase=True)
+        result = processor.clean_text("Patient BP 120/80, took 5 MG in ICU")
+        assert result == "patient bp 120/80, took 5 mg in icu"
+
+    def test_clean_text_uses_configured_abbreviation_spelling(self):
+        """Abbreviations are rewritten to the spelling in the configured set."""
+        processor = TextProcessor()
+        processor.medical_abbreviations.add("MRSA")
+        result = processor.clean_text("mrsa screen in the Icu")
+        assert result == "MRSA screen in the icu"
+
     def test_segment_sentences(self):
         """Test sentence segmentation."""
         processor = TextProcessor()
@@ -267,6 +280,30 @@ class TestOutputFormatter:
         data = result.to_dict()
         assert data["processing_time"] == pytest.approx(1.23)
 
+    def test_prediction_result_to_dict_copies_metadata(self):
+        """Serialized metadata is detached from the result it came from."""
+        result = PredictionResult(
+            text="demo",
+            entities=[EntityPrediction(text="demo", label="X", confidence=0.5)],
+            model_name="model",
+            timestamp="2025-10-17T00:00:00",
+            metadata={"route": {"lang": "en"}},
+        )
+
+        data = result.to_dict()
+        data["metadata"]["route"]["lang"] = "fr"
+
+        assert list(data) == [
+            "text",
+            "entities",
+            "model_name",
+            "timestamp",
+            "processing_time",
+            "metadata",
+        ]
+        assert data["entities"][0]["label"] == "X"
+        assert result.metadata == {"route": {"lang": "en"}}
+
     def test_format_predictions_with_threshold(self, sample_predictions, sample_text):
         """Test prediction formatting with confidence threshold."""
         formatter = OutputFormatter(confidence_threshold=0.9)
@@ -299,6 +336,30 @@ class TestOutputFormatter:
         assert "diabetes" in html_output
         assert "test-model" in html_output
 
+    def test_to_html_highlights_raw_offsets_after_escaping(self):
+        """Entity offsets should not drift when earlier text needs escaping."""
+        text = "BP <120 & HR >60, diabetes"
+        start = text.index("diabetes")
+        result = PredictionResult(
+            text=text,
+            entities=[
+                EntityPrediction(
+                    text="diabetes",
+                    label="CONDITION",
+                    confidence=0.9,
+                    start=start,
+                    end=start + len("diabetes"),
+                )
+            ],
+            model_name="test-model",
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        html_output = OutputFormatter().to_html(result)
+
+        assert "BP &lt;120 &amp; HR &gt;60, <span" in html_output
+        assert ">diabetes</span></p>" in html_output
+
     def test_to_csv_rows(self, test_helpers, sample_predictions, sample_text):
         """Test CSV rows generation."""
         formatter = OutputFormatter()
@@ -311,6 +372,20 @@ class TestOutputFormatter:
         assert "text" in csv_rows[0]
         assert "label" in csv_rows[0]
 
+    def test_iter_csv_rows_matches_to_csv_rows(
+        self, test_helpers, sample_predictions, sample_text
+    ):
+        """Test streamed CSV rows match the materialized list."""
+        formatter = OutputFormatter()
+        result = test_helpers.create_prediction_result(sample_text, sample_predictions)
+        result.entities[0].metadata = {"sentence_index": 0, "source": "model"}
+
+        rows = formatter.iter_csv_rows(result)
+
+        assert not isinstance(rows, list)
+        assert list(rows) == formatter.to_csv_rows(result)
+        assert formatter.to_csv_rows(result)[0]["metadata_source"] == "model"
+
     def test_sentencepiece_offsets_are_trimmed(self):
         """Leading whitespace from SentencePiece offsets should be removed."""
         text = "Patient diagnosed with acute lymphoblastic leukemia and started on imatinib."
@@ -619,6 +694,20 @@ class TestFormatPredictionsFunction:
         assert isinstance(result, PredictionResult)
         assert result.processing_time == 0.123
 
+    def test_format_predictions_uses_formatter_method_overrides(
+        self, sample_predictions, sample_text
+    ):
+        """Output rendering resolves methods on the formatter instance."""
+        with patch.object(OutputFormatter, "to_html", return_value="<patched/>"):
+            html_output = format_predictions(
+                sample_predictions,
+                sample_text,
+                model_name="test-model",
+                output_format="html",
+            )
+
+        assert html_output == "<patched/>"
+
     def test_format_predictions_invalid_format(self, sample_predictions, sample_text):
         """Test format_predictions function with invalid format."""
         with pytest.raises(ValueError, match="Unsupported output format"):
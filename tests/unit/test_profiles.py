@@ -42,6 +42,17 @@ class TestProfilePresets:
         assert "fast" in PROFILE_PRESETS
         assert PROFILE_PRESETS["fast"]["timeout"] == 120
 
+    def test_presets_are_read_only(self):
+        """Test built-in presets cannot be mutated in place."""
+        with pytest.raises(TypeError):
+            PROFILE_PRESETS["dev"]["log_level"] = "ERROR"
+        with pytest.raises(TypeError):
+            PROFILE_PRESETS["custom"] = {}
+
+        profile = get_profile("dev")
+        profile["log_level"] = "ERROR"
+        assert PROFILE_PRESETS["dev"]["log_level"] == "DEBUG"
+
 
 class TestOpenMedConfigProfiles:
     """Tests for OpenMedConfig profile methods."""
@@ -154,6 +165,30 @@ class TestListProfiles:
 
             assert "custom" in profiles
 
+    def test_list_ignores_non_profile_entries(self):
+        """Test listing skips directories and files without a .toml suffix."""
+        with TemporaryDirectory() as tmp_dir:
+            profiles_dir = Path(tmp_dir) / "profiles"
+            profiles_dir.mkdir()
+            (profiles_dir / "custom.toml").write_text("", encoding="utf-8")
+            (profiles_dir / "notes.txt").write_text("", encoding="utf-8")
+            (profiles_dir / "archive.toml").mkdir()
+
+            with patch("openmed.core.config.PROFILES_DIR", profiles_dir):
+                profiles = list_profiles()
+
+            assert "custom" in profiles
+            assert "notes" not in profiles
+            assert "archive" not in profiles
+            assert len(profiles) == len(set(profiles))
+
+    def test_list_without_profiles_dir(self):
+        """Test listing falls back to built-ins when the directory is missing."""
+        with TemporaryDirectory() as tmp_dir:
+            missing_dir = Path(tmp_dir) / "missing"
+            with patch("openmed.core.config.PROFILES_DIR", missing_dir):
+                assert list_profiles() == sorted(PROFILE_PRESETS)
+
 
 class TestGetProfile:
     """Tests for get_profile function."""
@@ -188,6 +223,42 @@ class TestGetProfile:
             assert settings["timeout"] == 999
             assert settings["log_level"] == "ERROR"
 
+    def test_get_custom_profile_reuses_parse_and_sees_rewrites(self):
+        """Cached profiles are copied per call and refreshed by save_profile."""
+        with TemporaryDirectory() as tmp_dir:
+            profiles_dir = Path(tmp_dir) / "profiles"
+
+            with patch("openmed.core.config.PROFILES_DIR", profiles_dir):
+                save_profile("cached", {"device": "cpu"})
+                first = get_profile("cached")
+                first["device"] = "mutated"
+                assert get_profile("cached") == {"device": "cpu"}
+
+                # Same byte size as the first write.
+                save_profile("cached", {"device": "mps"})
+                assert get_profile("cached") == {"device": "mps"}
+
+    def test_get_custom_profile_copies_nested_values(self):
+        """Mutating nested profile values does not leak into later reads."""
+        parsed = {"clinical_protect_terms": ["aspirin"], "extra": {"level": 1}}
+        with TemporaryDirectory() as tmp_dir:
+            profiles_dir = Path(tmp_dir) / "profiles"
+            profiles_dir.mkdir()
+            (profiles_dir / "nested.toml").write_text("", encoding="utf-8")
+
+            with (
+                patch("openmed.core.config.PROFILES_DIR", profiles_dir),
+                patch("openmed.core.config._load_toml", return_value=parsed),
+            ):
+                first = get_profile("nested")
+                first["clinical_protect_terms"].append("mutated")
+                first["extra"]["level"] = 2
+
+                assert get_profile("nested") == {
+                    "clinical_protect_terms": ["aspirin"],
+                    "extra": {"level": 1},
+                }
+
 
 class TestSaveProfile:
     """Tests for save_profile function."""
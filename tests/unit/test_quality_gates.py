@@ -335,6 +335,30 @@ class TestResolveOverlappingEntities:
         assert len(resolved) == 1
         assert resolved[0].metadata["risk_level"] == "high"
 
+    def test_many_overlapping_spans_keep_a_disjoint_maximal_set(self):
+        entities = [
+            _ent(
+                "x" * (3 + index % 5),
+                label="OTHER",
+                start=index * 2,
+                confidence=(index % 7) / 10,
+            )
+            for index in range(60)
+        ]
+
+        resolved = resolve_overlapping_entities(entities)
+
+        _assert_no_overlaps(resolved)
+        assert [entity.start for entity in resolved] == sorted(
+            entity.start for entity in resolved
+        )
+        for entity in entities:
+            if entity in resolved:
+                continue
+            assert any(
+                entity.start < kept.end and entity.end > kept.start for kept in resolved
+            )
+
     def test_validate_entity_spans_stays_warn_only_for_overlaps(self):
         text = "Patient John Doe visited"
         entities = [